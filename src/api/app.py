@@ -1,10 +1,28 @@
 
+import asyncio
 import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 
+from src.api.dependencies import (
+    get_action_history,
+    get_cat_service,
+    get_contextual_engine,
+    get_experience_buffers,
+    get_health_cache,
+    get_model_loader,
+    get_predictor,
+    get_profile_store,
+    get_readiness_cache,
+    get_settings,
+    get_start_monotonic,
+    get_trainer,
+    get_training_tasks,
+    singleton_dependency,
+)
+from src.api.health import HEALTH_CACHE_TTL, READINESS_CACHE_TTL, ProbeCache
 from src.api.middleware import LoggingMiddleware, RequestIdMiddleware
 from src.api.routes import api_router
 from src.core.config import settings
@@ -57,14 +75,45 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.cat_service = cat_service
     app.state.contextual_engine = contextual_engine
     app.state.profile_store = profile_store
-    app.state.start_time = time.time()
+    app.state.start_monotonic = time.monotonic()
+    app.state.experience_buffer = {}
+    app.state.training_tasks = {}
+    app.state.health_cache = ProbeCache(HEALTH_CACHE_TTL)
+    app.state.readiness_cache = ProbeCache(READINESS_CACHE_TTL)
+
+    singletons = {
+        get_settings: singleton_dependency(settings),
+        get_model_loader: singleton_dependency(model_loader),
+        get_predictor: singleton_dependency(predictor),
+        get_trainer: singleton_dependency(trainer),
+        get_action_history: singleton_dependency(action_history),
+        get_cat_service: singleton_dependency(cat_service),
+        get_contextual_engine: singleton_dependency(contextual_engine),
+        get_profile_store: singleton_dependency(profile_store),
+        get_start_monotonic: singleton_dependency(app.state.start_monotonic),
+        get_experience_buffers: singleton_dependency(app.state.experience_buffer),
+        get_training_tasks: singleton_dependency(app.state.training_tasks),
+        get_health_cache: singleton_dependency(app.state.health_cache),
+        get_readiness_cache: singleton_dependency(app.state.readiness_cache),
+    }
+    # Overrides installed before startup (e.g. by tests) take precedence.
+    provided = [dep for dep in singletons if dep not in app.dependency_overrides]
+    for dep in provided:
+        app.dependency_overrides[dep] = singletons[dep]
 
     logger.info("service_started")
 
     yield
 
 
+    training_tasks = list(app.state.training_tasks.values())
+    for task in training_tasks:
+        task.cancel()
+    await asyncio.gather(*training_tasks, return_exceptions=True)
+
     predictor.stop()
+    for dep in provided:
+        app.dependency_overrides.pop(dep, None)
     logger.info("service_stopped")
 
 
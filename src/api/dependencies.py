@@ -1,6 +1,9 @@
+import asyncio
+from typing import Any, Callable
 
 from fastapi import Request
 
+from src.api.health import ProbeCache
 from src.core.config import Settings
 from src.inference.model_loader import ModelLoader
 from src.inference.predictor import BatchPredictor
@@ -9,39 +12,63 @@ from src.services.cat_profile_store import CatProfileStore
 from src.services.contextual_engine import ContextualBehaviorEngine
 from src.training.trainer import CatBrainTrainer
 from src.utils.action_history import ActionHistory
+from src.utils.experience_buffer import ExperienceBuffer
 
 
-def get_predictor(request: Request) -> BatchPredictor:
+def singleton_dependency(value: Any) -> Callable[[], Any]:
+    async def dependency() -> Any:
+        return value
+
+    return dependency
+
+
+async def get_predictor(request: Request) -> BatchPredictor:
     return request.app.state.predictor
 
 
-def get_model_loader(request: Request) -> ModelLoader:
+async def get_model_loader(request: Request) -> ModelLoader:
     return request.app.state.model_loader
 
 
-def get_settings(request: Request) -> Settings:
+async def get_settings(request: Request) -> Settings:
     return request.app.state.settings
 
 
-def get_trainer(request: Request) -> CatBrainTrainer:
+async def get_trainer(request: Request) -> CatBrainTrainer:
     return request.app.state.trainer
 
 
-def get_action_history(request: Request) -> ActionHistory:
+async def get_action_history(request: Request) -> ActionHistory:
     return request.app.state.action_history
 
 
-def get_cat_service(request: Request) -> CatService:
+async def get_cat_service(request: Request) -> CatService:
     return request.app.state.cat_service
 
 
-def get_profile_store(request: Request) -> CatProfileStore:
+async def get_profile_store(request: Request) -> CatProfileStore:
     return request.app.state.profile_store
 
 
-def get_start_time(request: Request) -> float:
-    return request.app.state.start_time
+async def get_start_monotonic(request: Request) -> float:
+    return request.app.state.start_monotonic
 
 
-def get_contextual_engine(request: Request) -> ContextualBehaviorEngine:
+async def get_contextual_engine(request: Request) -> ContextualBehaviorEngine:
     return request.app.state.contextual_engine
+
+
+async def get_experience_buffers(request: Request) -> dict[str, ExperienceBuffer]:
+    return request.app.state.experience_buffer
+
+
+async def get_training_tasks(request: Request) -> dict[str, asyncio.Task]:
+    return request.app.state.training_tasks
+
+
+async def get_health_cache(request: Request) -> ProbeCache:
+    return request.app.state.health_cache
+
+
+async def get_readiness_cache(request: Request) -> ProbeCache:
+    return request.app.state.readiness_cache
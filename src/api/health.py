@@ -1,46 +1,65 @@
 import time
+from typing import Callable, Optional
 
 from src.core.config import Settings
 from src.inference.model_loader import ModelLoader
 from src.inference.predictor import BatchPredictor
 
+HEALTH_CACHE_TTL: float = 5.0
+READINESS_CACHE_TTL: float = 1.0
 
-def get_health_status(
-    model_loader: ModelLoader, predictor: BatchPredictor, config: Settings, start_time: float
-) -> dict:
-    model_loaded = False
-    model_version = config.MODEL_VERSION
 
+class ProbeCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._value: Optional[dict] = None
+        self._expires_at: float = 0.0
+
+    def get(self, compute: Callable[[], dict]) -> dict:
+        now = time.monotonic()
+        if self._value is None or now >= self._expires_at:
+            self._value = compute()
+            self._expires_at = now + self.ttl
+        return self._value
+
+
+def _is_model_loaded(model_loader: ModelLoader, version: str) -> bool:
     try:
-        model = model_loader.get_model(model_version)
-        model_loaded = model is not None
+        return model_loader.get_model(version) is not None
     except Exception:
-        model_loaded = False
+        return False
 
-    cache_available = predictor.cache.is_available() if predictor.cache else False
 
-    uptime = time.time() - start_time
+def get_health_status(
+    model_loader: ModelLoader,
+    predictor: BatchPredictor,
+    config: Settings,
+    start_monotonic: float,
+    cache: ProbeCache,
+) -> dict:
+    def probe() -> dict:
+        return {
+            "model_loaded": _is_model_loaded(model_loader, config.MODEL_VERSION),
+            "model_version": config.MODEL_VERSION,
+            "cache_available": predictor.cache.is_available() if predictor.cache else False,
+        }
+
+    probed = cache.get(probe)
+    uptime = time.monotonic() - start_monotonic
 
-    status = "healthy" if model_loaded else "degraded"
+    status = "healthy" if probed["model_loaded"] else "degraded"
 
     return {
         "status": status,
-        "model_loaded": model_loaded,
-        "model_version": model_version,
-        "cache_available": cache_available,
+        **probed,
         "uptime": round(uptime, 2),
     }
 
 
-def get_readiness_status(model_loader: ModelLoader, config: Settings) -> dict:
-    try:
-        model = model_loader.get_model(config.MODEL_VERSION)
-        if model is not None:
-            return {"ready": True}
-    except Exception:
-        pass
-
-    return {"ready": False}
+def get_readiness_status(model_loader: ModelLoader, config: Settings, cache: ProbeCache) -> dict:
+    return cache.get(
+        lambda: {"ready": _is_model_loaded(model_loader, config.MODEL_VERSION)}
+    )
 
 
 def get_liveness_status() -> dict:
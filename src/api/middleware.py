@@ -1,45 +1,91 @@
+import itertools
+import os
+import random
 import time
-from typing import Callable
+import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.config import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_REQUEST_ID_PREFIX: str = os.urandom(6).hex()
+_request_id_counter = itertools.count()
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
-        request_id = request.headers.get("X-Request-ID", "")
+# Probe traffic; logging its successes drowns out real requests.
+_UNLOGGED_PATHS = frozenset({"/live", "/metrics"})
 
-        response = await call_next(request)
 
-        latency = time.time() - start_time
+def generate_request_id() -> str:
+    if settings.REQUEST_ID_MODE == "uuid":
+        return str(uuid.uuid4())
+    return f"{_REQUEST_ID_PREFIX}-{next(_request_id_counter):x}"
 
-        logger.info(
-            "request_completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            latency_ms=round(latency * 1000, 2),
-            request_id=request_id,
-        )
 
-        return response
+class LoggingMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        import uuid
+        start_ns = time.monotonic_ns()
+        status_code = 500
 
-        request_id = request.headers.get("X-Request-ID")
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            latency_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            if (
+                status_code >= 400
+                or latency_ms > settings.LOG_SLOW_MS
+                or (
+                    scope["path"] not in _UNLOGGED_PATHS
+                    and random.random() < settings.LOG_SAMPLE_RATE
+                )
+            ):
+                request_id = scope.get("state", {}).get("request_id") or Headers(
+                    scope=scope
+                ).get("X-Request-ID", "")
+
+                logger.info(
+                    "request_completed",
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_code,
+                    latency_ms=latency_ms,
+                    request_id=request_id,
+                )
+
+
+class RequestIdMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("X-Request-ID")
         if not request_id:
-            request_id = str(uuid.uuid4())
+            request_id = generate_request_id()
+        scope.setdefault("state", {})["request_id"] = request_id
 
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
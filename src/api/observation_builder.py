@@ -1,23 +1,42 @@
+from typing import Optional, Sequence
 
 import numpy as np
 
 from src.api.schemas import CatState
 from src.core.environment import ObservationIndex
 
+OBSERVATION_SIZE: int = len(ObservationIndex)
 
-def build_observation(state: CatState) -> np.ndarray:
-    obs = np.zeros(len(ObservationIndex), dtype=np.float32)
-    
-    obs[ObservationIndex.HUNGER] = state.hunger
-    obs[ObservationIndex.ENERGY] = state.energy
-    obs[ObservationIndex.DISTANCE_FOOD] = state.distance_to_food
-    obs[ObservationIndex.DISTANCE_TOY] = state.distance_to_toy
-    obs[ObservationIndex.DISTANCE_BED] = state.distance_to_bed
-    obs[ObservationIndex.MOOD] = state.mood
-    obs[ObservationIndex.LAZY_SCORE] = state.lazy_score
-    obs[ObservationIndex.FOODIE_SCORE] = state.foodie_score
-    obs[ObservationIndex.PLAYFUL_SCORE] = state.playful_score
-    obs[ObservationIndex.IS_BOWL_EMPTY] = 1.0 if state.is_bowl_empty else 0.0
-    obs[ObservationIndex.IS_BOWL_TIPPED] = 1.0 if state.is_bowl_tipped else 0.0
-    
-    return obs
+# build_observation fills values positionally, so the index enum must stay dense and ordered.
+assert [int(index) for index in ObservationIndex] == list(range(OBSERVATION_SIZE))
+
+
+def _observation_values(state: CatState) -> tuple[float, ...]:
+    return (
+        state.hunger,
+        state.energy,
+        state.distance_to_food,
+        state.distance_to_toy,
+        state.distance_to_bed,
+        state.mood,
+        state.lazy_score,
+        state.foodie_score,
+        state.playful_score,
+        1.0 if state.is_bowl_empty else 0.0,
+        1.0 if state.is_bowl_tipped else 0.0,
+    )
+
+
+def build_observation(state: CatState, out: Optional[np.ndarray] = None) -> np.ndarray:
+    values = _observation_values(state)
+
+    if out is None:
+        return np.array(values, dtype=np.float32)
+
+    out[:] = values
+    return out
+
+
+def build_observations(states: Sequence[CatState]) -> np.ndarray:
+    rows = [_observation_values(state) for state in states]
+    return np.array(rows, dtype=np.float32).reshape(len(rows), OBSERVATION_SIZE)
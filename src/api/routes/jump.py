@@ -38,12 +38,20 @@ class JumpResultResponse(BaseModel):
     message: str
 
 
+class JumpMemoryResponse(BaseModel):
+    cat_id: str
+    targets: dict[str, dict]
+    total_targets: int
+
+
+class ResetMemoryResponse(BaseModel):
+    status: str
+    target_id: str
+
+
 @router.post("/predict", response_model=JumpForceResponse)
 async def predict_jump_force(request: JumpForceRequest):
-    memories = jump_service.get_all_memories(request.cat_id)
-    from_memory = request.target_id in memories
-    
-    force = jump_service.get_jump_force(
+    force, from_memory = jump_service.lookup_jump_force(
         cat_id=request.cat_id,
         target_id=request.target_id,
         height_diff=request.height_diff,
@@ -75,7 +83,7 @@ async def record_jump_result(request: JumpResultRequest):
     )
 
 
-@router.get("/memory/{cat_id}")
+@router.get("/memory/{cat_id}", response_model=JumpMemoryResponse)
 async def get_jump_memory(cat_id: str):
     memories = jump_service.get_all_memories(cat_id)
     return {
@@ -85,7 +93,7 @@ async def get_jump_memory(cat_id: str):
     }
 
 
-@router.delete("/memory/{cat_id}/{target_id}")
+@router.delete("/memory/{cat_id}/{target_id}", response_model=ResetMemoryResponse)
 async def reset_target_memory(cat_id: str, target_id: str):
     success = jump_service.reset_target_memory(cat_id, target_id)
     
@@ -1,9 +1,15 @@
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from typing import List
 import asyncio
+import operator
 
+import numpy as np
+
+from src.api.dependencies import get_experience_buffers, get_training_tasks
+from src.api.json_body import json_body, json_body_openapi
 from src.api.schemas import ObservationSchema
+from src.utils.experience_buffer import STATE_FIELDS, TRANSITION_SIZE, ExperienceBuffer
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +18,9 @@ router = APIRouter(tags=["learning"])
 
 TRAINING_THRESHOLD = 100
 TRAINING_BATCH_SIZE = 64
+EXPERIENCE_BUFFER_CAPACITY = 10_000
+
+_state_row = operator.attrgetter(*STATE_FIELDS)
 
 
 class ExperienceSchema(BaseModel):
@@ -36,102 +45,105 @@ class SubmitExperienceBatchRequest(BaseModel):
     experiences: List[ExperienceSchema]
 
 
-@router.post("/experience")
-async def submit_experience(request: Request, data: SubmitExperienceRequest):
-    logger.info("submit_experience", cat_id=data.cat_id, reward=data.reward)
-    
-    experience_buffer = getattr(request.app.state, 'experience_buffer', {})
-    
-    if data.cat_id not in experience_buffer:
-        experience_buffer[data.cat_id] = []
-    
-    experience_buffer[data.cat_id].append({
-        'state': [
-            data.state.hunger,
-            data.state.energy,
-            data.state.distance_to_food,
-            data.state.distance_to_toy,
-            data.state.mood,
-            data.state.lazy_score,
-            data.state.foodie_score,
-            data.state.playful_score,
-        ],
-        'action': data.action,
-        'reward': data.reward,
-        'next_state': [
-            data.next_state.hunger,
-            data.next_state.energy,
-            data.next_state.distance_to_food,
-            data.next_state.distance_to_toy,
-            data.next_state.mood,
-            data.next_state.lazy_score,
-            data.next_state.foodie_score,
-            data.next_state.playful_score,
-        ],
-        'done': data.done,
-    })
+class SubmitExperienceBatchResponse(BaseModel):
+    status: str
+    total_experiences: int
+
+
+@router.post(
+    "/experience",
+    response_model=dict[str, str],
+    openapi_extra=json_body_openapi(SubmitExperienceRequest),
+)
+async def submit_experience(
+    data: SubmitExperienceRequest = Depends(json_body(SubmitExperienceRequest)),
+    experience_buffers: dict[str, ExperienceBuffer] = Depends(get_experience_buffers),
+    training_tasks: dict[str, asyncio.Task] = Depends(get_training_tasks),
+):
+    logger.debug("submit_experience", cat_id=data.cat_id, reward=data.reward)
     
-    request.app.state.experience_buffer = experience_buffer
+    buffer = _get_buffer(experience_buffers, data.cat_id)
+    buffer.append(
+        _state_row(data.state),
+        data.action,
+        data.reward,
+        _state_row(data.next_state),
+        data.done,
+    )
     
-    if len(experience_buffer[data.cat_id]) >= TRAINING_THRESHOLD:
-        asyncio.create_task(_trigger_training(request, data.cat_id))
+    if len(buffer) >= TRAINING_THRESHOLD:
+        _schedule_training(experience_buffers, training_tasks, data.cat_id)
     
     return {"status": "ok"}
 
 
-@router.post("/experience/batch")
-async def submit_experience_batch(request: Request, data: SubmitExperienceBatchRequest):
+@router.post(
+    "/experience/batch",
+    response_model=SubmitExperienceBatchResponse,
+    openapi_extra=json_body_openapi(SubmitExperienceBatchRequest),
+)
+async def submit_experience_batch(
+    data: SubmitExperienceBatchRequest = Depends(json_body(SubmitExperienceBatchRequest)),
+    experience_buffers: dict[str, ExperienceBuffer] = Depends(get_experience_buffers),
+    training_tasks: dict[str, asyncio.Task] = Depends(get_training_tasks),
+):
     logger.info("submit_experience_batch", cat_id=data.cat_id, count=len(data.experiences))
     
-    experience_buffer = getattr(request.app.state, 'experience_buffer', {})
-    
-    if data.cat_id not in experience_buffer:
-        experience_buffer[data.cat_id] = []
-    
-    for exp in data.experiences:
-        experience_buffer[data.cat_id].append({
-            'state': [
-                exp.state.hunger,
-                exp.state.energy,
-                exp.state.distance_to_food,
-                exp.state.distance_to_toy,
-                exp.state.mood,
-                exp.state.lazy_score,
-                exp.state.foodie_score,
-                exp.state.playful_score,
-            ],
-            'action': exp.action,
-            'reward': exp.reward,
-            'next_state': [
-                exp.next_state.hunger,
-                exp.next_state.energy,
-                exp.next_state.distance_to_food,
-                exp.next_state.distance_to_toy,
-                exp.next_state.mood,
-                exp.next_state.lazy_score,
-                exp.next_state.foodie_score,
-                exp.next_state.playful_score,
-            ],
-            'done': exp.done,
-        })
+    buffer = _get_buffer(experience_buffers, data.cat_id)
+    experiences = data.experiences
+    n = len(experiences)
+    buffer.extend(
+        np.array(
+            [_state_row(exp.state) + _state_row(exp.next_state) for exp in experiences],
+            dtype=np.float32,
+        ).reshape(n, TRANSITION_SIZE),
+        np.fromiter((exp.action for exp in experiences), dtype=np.int8, count=n),
+        np.fromiter((exp.reward for exp in experiences), dtype=np.float32, count=n),
+        np.fromiter((exp.done for exp in experiences), dtype=np.bool_, count=n),
+    )
     
-    request.app.state.experience_buffer = experience_buffer
+    if len(buffer) >= TRAINING_THRESHOLD:
+        logger.info("experience_buffer_full", cat_id=data.cat_id, size=len(buffer))
+        _schedule_training(experience_buffers, training_tasks, data.cat_id)
     
-    if len(experience_buffer[data.cat_id]) >= TRAINING_THRESHOLD:
-        logger.info("experience_buffer_full", cat_id=data.cat_id, size=len(experience_buffer[data.cat_id]))
-        asyncio.create_task(_trigger_training(request, data.cat_id))
-    
-    return {"status": "ok", "total_experiences": len(experience_buffer[data.cat_id])}
+    return {"status": "ok", "total_experiences": len(buffer)}
+
+
+def _get_buffer(experience_buffers: dict[str, ExperienceBuffer], cat_id: str) -> ExperienceBuffer:
+    buffer = experience_buffers.get(cat_id)
+    if buffer is None:
+        buffer = experience_buffers[cat_id] = ExperienceBuffer(EXPERIENCE_BUFFER_CAPACITY)
+    return buffer
+
+
+def _schedule_training(
+    experience_buffers: dict[str, ExperienceBuffer],
+    training_tasks: dict[str, asyncio.Task],
+    cat_id: str,
+) -> None:
+    task = training_tasks.get(cat_id)
+    if task is not None and not task.done():
+        return
 
+    task = asyncio.create_task(_trigger_training(experience_buffers, cat_id))
+    training_tasks[cat_id] = task
+    task.add_done_callback(lambda _: training_tasks.pop(cat_id, None))
 
-async def _trigger_training(request: Request, cat_id: str):
+
+async def _trigger_training(experience_buffers: dict[str, ExperienceBuffer], cat_id: str):
     try:
-        logger.info("auto_training_skipped", cat_id=cat_id)
-        experience_buffer = getattr(request.app.state, 'experience_buffer', {})
-        if cat_id in experience_buffer:
-            experience_buffer[cat_id] = []
-            request.app.state.experience_buffer = experience_buffer
+        buffer = experience_buffers.get(cat_id)
+        if buffer is None:
+            return
+
+        experiences = buffer.drain()
+        # Training works on the drained copy in a worker thread so it never blocks the event loop.
+        await asyncio.to_thread(_train_on_experiences, cat_id, experiences)
         logger.info("auto_training_completed", cat_id=cat_id)
         
     except Exception as e:
         logger.error("auto_training_failed", cat_id=cat_id, error=str(e))
+
+
+def _train_on_experiences(cat_id: str, experiences: dict[str, np.ndarray]) -> None:
+    logger.info("auto_training_skipped", cat_id=cat_id, experiences=len(experiences["actions"]))
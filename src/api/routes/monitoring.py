@@ -1,9 +1,20 @@
+import json
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.responses import PlainTextResponse
 
-from src.api.dependencies import get_model_loader, get_predictor, get_settings, get_start_time
+from src.api.dependencies import (
+    get_health_cache,
+    get_model_loader,
+    get_predictor,
+    get_readiness_cache,
+    get_settings,
+    get_start_monotonic,
+)
 from src.api.health import (
+    HEALTH_CACHE_TTL,
+    READINESS_CACHE_TTL,
+    ProbeCache,
     get_health_status,
     get_liveness_status,
     get_readiness_status,
@@ -12,42 +23,50 @@ from src.api.schemas import HealthCheck
 from src.core.config import Settings
 from src.inference.model_loader import ModelLoader
 from src.inference.predictor import BatchPredictor
-from src.utils.metrics import get_metrics
+from src.utils.metrics import METRICS_CONTENT_TYPE, get_metrics
 
 router = APIRouter(tags=["monitoring"])
 
+_LIVENESS_BODY: bytes = json.dumps(get_liveness_status(), separators=(",", ":")).encode()
+
 
 @router.get("/health", response_model=HealthCheck)
 async def health_check(
+    response: Response,
     model_loader: ModelLoader = Depends(get_model_loader),
     predictor: BatchPredictor = Depends(get_predictor),
     config: Settings = Depends(get_settings),
-    start_time: float = Depends(get_start_time),
+    start_monotonic: float = Depends(get_start_monotonic),
+    cache: ProbeCache = Depends(get_health_cache),
 ):
 
-    status = get_health_status(model_loader, predictor, config, start_time)
-    return HealthCheck(**status)
+    status = get_health_status(model_loader, predictor, config, start_monotonic, cache)
+    response.headers["Cache-Control"] = f"max-age={int(HEALTH_CACHE_TTL)}"
+    return status
 
 
-@router.get("/ready")
+@router.get("/ready", response_model=dict[str, bool])
 async def readiness_check(
+    response: Response,
     model_loader: ModelLoader = Depends(get_model_loader),
     config: Settings = Depends(get_settings),
+    cache: ProbeCache = Depends(get_readiness_cache),
 ):
 
-    status = get_readiness_status(model_loader, config)
+    status = get_readiness_status(model_loader, config, cache)
     if not status["ready"]:
         raise HTTPException(status_code=503, detail="Service not ready")
+    response.headers["Cache-Control"] = f"max-age={int(READINESS_CACHE_TTL)}"
     return status
 
 
-@router.get("/live")
+@router.get("/live", response_model=dict[str, bool])
 async def liveness_check():
 
-    return get_liveness_status()
+    return Response(content=_LIVENESS_BODY, media_type="application/json")
 
 
 @router.get("/metrics", response_class=PlainTextResponse)
 async def metrics():
 
-    return get_metrics()
+    return Response(content=get_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -1,9 +1,12 @@
+import threading
+from typing import Optional
 
 import numpy as np
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 
 from src.api.dependencies import get_contextual_engine, get_predictor
-from src.api.observation_builder import build_observation
+from src.api.json_body import json_body, json_body_openapi
+from src.api.observation_builder import OBSERVATION_SIZE, build_observation, build_observations
 from src.api.schemas import (
     BatchCatActions,
     BatchCatStates,
@@ -20,27 +23,50 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/predict", tags=["predictions"])
 
-ACTION_NAMES: dict[int, str] = {
-    CatActionEnum.IDLE: "idle",
-    CatActionEnum.MOVE_TO_FOOD: "move_to_food",
-    CatActionEnum.MOVE_TO_TOY: "move_to_toy",
-    CatActionEnum.SLEEP: "sleep",
-    CatActionEnum.GROOM: "groom",
-    CatActionEnum.PLAY: "play",
-    CatActionEnum.EXPLORE: "explore",
-    CatActionEnum.MEOW_AT_BOWL: "meow_at_bowl",
-}
+ACTION_NAMES: tuple[str, ...] = (
+    "idle",
+    "move_to_food",
+    "move_to_toy",
+    "sleep",
+    "groom",
+    "play",
+    "explore",
+    "meow_at_bowl",
+)
+
+# ACTION_NAMES is indexed by action id, so it must follow CatActionEnum order.
+assert tuple(action.name.lower() for action in CatActionEnum) == ACTION_NAMES
+
+_OBS_BUF = threading.local()
+
+
+def _observation_buffer() -> np.ndarray:
+    buf = getattr(_OBS_BUF, "v", None)
+    if buf is None:
+        buf = _OBS_BUF.v = np.empty(OBSERVATION_SIZE, dtype=np.float32)
+    return buf
+
 
+def action_name(action: int) -> Optional[str]:
+    return ACTION_NAMES[action] if 0 <= action < len(ACTION_NAMES) else None
 
-@router.post("", response_model=CatAction, responses={500: {"model": ErrorResponse}})
+
+@router.post(
+    "",
+    response_model=CatAction,
+    responses={500: {"model": ErrorResponse}},
+    openapi_extra=json_body_openapi(CatState),
+)
 async def predict(
-    state: CatState,
+    state: CatState = Depends(json_body(CatState)),
     predictor: BatchPredictor = Depends(get_predictor),
     contextual_engine: ContextualBehaviorEngine = Depends(get_contextual_engine),
 ):
     try:
-        obs = build_observation(state)
-        
+        # predict_single copies the observation before its first await, so the
+        # per-thread buffer can be reused across requests.
+        obs = build_observation(state, out=_observation_buffer())
+
         base_action = await predictor.predict_single(
             obs,
             cat_id=state.cat_id,
@@ -53,9 +79,11 @@ async def predict(
             cat_id=state.cat_id,
         )
         
-        return CatAction(
+        # Built from typed engine output, so skip both constructor and
+        # response-model validation and encode once.
+        response = CatAction.model_construct(
             action=result["action"],
-            action_name=ACTION_NAMES.get(result["action"]),
+            action_name=action_name(result["action"]),
             emotion=result["emotional_state"].primary_emotion.value,
             emotion_intensity=result["emotional_state"].intensity.value,
             mood_change=result["mood_delta"],
@@ -67,6 +95,7 @@ async def predict(
             visual_layers=result.get("visual_layers"),
             visual_primary=result.get("visual_primary"),
         )
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except FileNotFoundError:
         raise HTTPException(status_code=503, detail="Base model not loaded")
     except Exception as e:
@@ -74,18 +103,28 @@ async def predict(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("_batch", response_model=BatchCatActions, responses={500: {"model": ErrorResponse}})
+@router.post(
+    "_batch",
+    response_model=BatchCatActions,
+    responses={500: {"model": ErrorResponse}},
+    openapi_extra=json_body_openapi(BatchCatStates),
+)
 async def predict_batch(
-    batch: BatchCatStates,
+    batch: BatchCatStates = Depends(json_body(BatchCatStates)),
     predictor: BatchPredictor = Depends(get_predictor),
 ):
     try:
+        observations = build_observations(batch.states)
         payload = [
-            (build_observation(state), state.cat_id, state.personality.value)
-            for state in batch.states
+            (observations[i], state.cat_id, state.personality.value)
+            for i, state in enumerate(batch.states)
         ]
         actions = await predictor.predict_batch(payload)
-        return BatchCatActions(actions=actions)
+        # The predictor only yields ints, so skip response-model validation and encode once.
+        return Response(
+            content=BatchCatActions.model_construct(actions=actions).model_dump_json(),
+            media_type="application/json",
+        )
     except FileNotFoundError:
         raise HTTPException(status_code=503, detail="Model not loaded")
     except Exception as e:
@@ -1,10 +1,41 @@
 import random
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from typing import Optional
 
 import numpy as np
 
-from src.core.environment import CatAction
+from src.core.environment import CatAction, EnvConstants
+
+# Shared by the batch helpers; building a Generator costs ~12us per call.
+# Scalar paths stay on random.random(), which beats indexing a NumPy draw buffer.
+_RNG = np.random.default_rng()
+
+ACTIVE_ACTIONS: frozenset[int] = frozenset(
+    {CatAction.MOVE_TO_FOOD, CatAction.MOVE_TO_TOY, CatAction.PLAY, CatAction.EXPLORE}
+)
+
+# Every action except the indexed one, for picking a different action in one draw.
+_ALTERNATIVE_ACTIONS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(other for other in range(EnvConstants.NUM_ACTIONS) if other != action)
+    for action in range(EnvConstants.NUM_ACTIONS)
+)
+
+
+def _quirk_table(quirks: list[tuple[int, float]]) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    # Quirks are tried in order, each with its own chance, so quirk i fires with
+    # probability p_i * prod(1 - p_j for j < i); one uniform draw against the
+    # cumulative sums reproduces that distribution.
+    cumulative = []
+    total = 0.0
+    remaining = 1.0
+    for _, probability in quirks:
+        total += remaining * probability
+        remaining *= 1 - probability
+        cumulative.append(total)
+    return tuple(cumulative), tuple(action for action, _ in quirks)
 
 
 @dataclass
@@ -56,23 +87,27 @@ class BehaviorLibrary:
         ),
     }
     
+    _BASE_QUIRKS = [
+        (CatAction.GROOM, 0.05),
+        (CatAction.EXPLORE, 0.03),
+        (CatAction.MEOW_AT_BOWL, 0.02),
+    ]
+    # Keyed by (mood > 70, energy < 40).
+    _QUIRK_TABLES = {
+        (False, False): _quirk_table(_BASE_QUIRKS),
+        (True, False): _quirk_table(_BASE_QUIRKS + [(CatAction.PLAY, 0.04)]),
+        (False, True): _quirk_table(_BASE_QUIRKS + [(CatAction.SLEEP, 0.06)]),
+        (True, True): _quirk_table(
+            _BASE_QUIRKS + [(CatAction.PLAY, 0.04), (CatAction.SLEEP, 0.06)]
+        ),
+    }
+
     @staticmethod
     def get_random_quirk_action(mood: float, energy: float) -> Optional[int]:
-        quirks = [
-            (CatAction.GROOM, 0.05),
-            (CatAction.EXPLORE, 0.03),
-            (CatAction.MEOW_AT_BOWL, 0.02),
-        ]
-        
-        if mood > 70:
-            quirks.append((CatAction.PLAY, 0.04))
-        
-        if energy < 40:
-            quirks.append((CatAction.SLEEP, 0.06))
-        
-        for action, probability in quirks:
-            if random.random() < probability:
-                return action
+        cumulative, actions = BehaviorLibrary._QUIRK_TABLES[(mood > 70, energy < 40)]
+        index = bisect_right(cumulative, random.random())
+        if index < len(actions):
+            return actions[index]
         
         return None
 
@@ -95,11 +130,29 @@ class StochasticBehavior:
         effective_randomness = randomness * (1 - confidence)
         
         if random.random() < effective_randomness:
-            available_actions = list(range(8))
-            available_actions.remove(base_action)
-            return random.choice(available_actions)
+            return random.choice(_ALTERNATIVE_ACTIONS[base_action])
         
         return base_action
+
+    @staticmethod
+    def add_noise_to_predictions_batch(
+        base_actions: np.ndarray,
+        confidence: float | np.ndarray = 0.8,
+        mood: float | np.ndarray = 50.0,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        rng = rng or _RNG
+        base_actions = np.asarray(base_actions, dtype=np.int64)
+        n = len(base_actions)
+        mood = np.asarray(mood, dtype=np.float64)
+
+        randomness = 0.2 + np.where(mood < 30, 0.1, np.where(mood > 80, 0.05, 0.0))
+        change = rng.random(n) < randomness * (1 - np.asarray(confidence))
+
+        # Draw from the other NUM_ACTIONS - 1 actions by shifting past the base action.
+        alternatives = rng.integers(0, EnvConstants.NUM_ACTIONS - 1, size=n)
+        alternatives += alternatives >= base_actions
+        return np.where(change, alternatives, base_actions)
     
     @staticmethod
     def should_change_mind(
@@ -161,9 +214,9 @@ class CatMemory:
     
     def __init__(self, capacity: int = 50):
         self.capacity = capacity
-        self.recent_actions: list[int] = []
-        self.recent_moods: list[float] = []
-        self.recent_rewards: list[float] = []
+        self.recent_actions: deque[int] = deque(maxlen=capacity)
+        self.recent_moods: deque[float] = deque(maxlen=capacity)
+        self.recent_rewards: deque[float] = deque(maxlen=capacity)
         self.interaction_count: int = 0
         self.last_pet_time: Optional[float] = None
         self.last_food_time: Optional[float] = None
@@ -172,25 +225,17 @@ class CatMemory:
         self.recent_actions.append(action)
         self.recent_moods.append(mood)
         self.recent_rewards.append(reward)
-        
-        if len(self.recent_actions) > self.capacity:
-            self.recent_actions.pop(0)
-            self.recent_moods.pop(0)
-            self.recent_rewards.pop(0)
+
+    def _last_actions(self, count: int) -> list[int]:
+        # Newest first; callers only count or dedupe, so order does not matter.
+        return list(islice(reversed(self.recent_actions), count))
     
     def get_recent_activity_level(self) -> float:
         if not self.recent_actions:
             return 0.0
         
-        active_actions = [
-            CatAction.MOVE_TO_FOOD,
-            CatAction.MOVE_TO_TOY,
-            CatAction.PLAY,
-            CatAction.EXPLORE,
-        ]
-        
-        recent_window = self.recent_actions[-10:]
-        active_count = sum(1 for a in recent_window if a in active_actions)
+        recent_window = self._last_actions(10)
+        active_count = sum(1 for a in recent_window if a in ACTIVE_ACTIONS)
         
         return active_count / len(recent_window)
     
@@ -198,7 +243,7 @@ class CatMemory:
         if not self.recent_actions:
             return 0.0
         
-        recent_window = self.recent_actions[-10:]
+        recent_window = self._last_actions(10)
         unique_actions = len(set(recent_window))
         
         return unique_actions / 8.0
@@ -207,7 +252,7 @@ class CatMemory:
         if len(self.recent_actions) < 5:
             return False
         
-        last_five = self.recent_actions[-5:]
+        last_five = self._last_actions(5)
         return len(set(last_five)) <= 2
     
     def record_interaction(self, interaction_type: str, timestamp: float):
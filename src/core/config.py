@@ -33,7 +33,7 @@ class Settings(BaseSettings):
     TOTAL_TIMESTEPS: int = 100_000
 
     BATCH_SIZE: int = 32
-    BATCH_TIMEOUT: float = 0.1
+    BATCH_TIMEOUT: float = 0.01
 
     CACHE_ENABLED: bool = False
     REDIS_URL: str = "redis://localhost:6379"
@@ -44,6 +44,9 @@ class Settings(BaseSettings):
     WORKERS: int = 1
 
     LOG_LEVEL: str = "INFO"
+    REQUEST_ID_MODE: str = "counter"
+    LOG_SAMPLE_RATE: float = 0.01
+    LOG_SLOW_MS: float = 100.0
     ENABLE_METRICS: bool = True
     ACTION_HISTORY_MAX_ENTRIES_PER_CAT: int = 500
     ACTION_HISTORY_MAX_AGE_DAYS: int = 30
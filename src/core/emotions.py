@@ -1,5 +1,7 @@
+import math
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
@@ -79,11 +81,8 @@ class EmotionEngine:
         activity_arousal = recent_activity * 0.2
         noise_arousal = noise_level * 0.1
         
-        return np.clip(
-            hunger_arousal + energy_arousal + activity_arousal + noise_arousal,
-            0.0,
-            1.0,
-        )
+        arousal = hunger_arousal + energy_arousal + activity_arousal + noise_arousal
+        return max(0.0, min(arousal, 1.0))
     
     @staticmethod
     def determine_emotion(
@@ -92,27 +91,22 @@ class EmotionEngine:
         energy: float,
         arousal: float,
     ) -> EmotionType:
-        valence = (mood / 100 - 0.5) * 2
-        
-        for emotion, thresholds in EmotionEngine.EMOTION_THRESHOLDS.items():
-            matches = True
-            
-            if "mood_min" in thresholds and mood < thresholds["mood_min"]:
-                matches = False
-            if "mood_max" in thresholds and mood > thresholds["mood_max"]:
-                matches = False
-            if "hunger_min" in thresholds and hunger < thresholds["hunger_min"]:
-                matches = False
-            if "energy_min" in thresholds and energy < thresholds["energy_min"]:
-                matches = False
-            if "energy_max" in thresholds and energy > thresholds["energy_max"]:
-                matches = False
-            if "arousal_min" in thresholds and arousal < thresholds["arousal_min"]:
-                matches = False
-            if "arousal_max" in thresholds and arousal > thresholds["arousal_max"]:
-                matches = False
-            
-            if matches:
+        for (
+            emotion,
+            mood_min,
+            mood_max,
+            hunger_min,
+            energy_min,
+            energy_max,
+            arousal_min,
+            arousal_max,
+        ) in _THRESHOLD_ROWS:
+            if (
+                mood_min <= mood <= mood_max
+                and hunger >= hunger_min
+                and energy_min <= energy <= energy_max
+                and arousal_min <= arousal <= arousal_max
+            ):
                 return emotion
         
         return EmotionType.CONTENT
@@ -157,9 +151,7 @@ class EmotionEngine:
             hunger, energy, recent_activity, noise_level
         )
         
-        emotion = EmotionEngine.determine_emotion(mood, hunger, energy, arousal)
-        
-        intensity = EmotionEngine.calculate_intensity(mood, arousal, hunger, energy)
+        emotion, intensity = _classify(mood, hunger, energy, arousal)
         
         valence = (mood / 100 - 0.5) * 2
         
@@ -170,3 +162,111 @@ class EmotionEngine:
             arousal_level=arousal,
             valence=valence,
         )
+
+    @staticmethod
+    def get_emotional_state_batch(
+        mood: np.ndarray,
+        hunger: np.ndarray,
+        energy: np.ndarray,
+        recent_activity: float | np.ndarray = 0.0,
+        noise_level: float | np.ndarray = 0.0,
+    ) -> dict[str, np.ndarray]:
+        mood = np.asarray(mood, dtype=np.float64)
+        hunger = np.asarray(hunger, dtype=np.float64)
+        energy = np.asarray(energy, dtype=np.float64)
+
+        arousal = np.clip(
+            (100 - hunger) / 100 * 0.3
+            + energy / 100 * 0.4
+            + np.asarray(recent_activity) * 0.2
+            + np.asarray(noise_level) * 0.1,
+            0.0,
+            1.0,
+        )
+
+        # (N, emotions) match matrix; argmax picks the first matching emotion like the scalar path.
+        matches = (
+            (mood[:, None] >= _MOOD_MIN)
+            & (mood[:, None] <= _MOOD_MAX)
+            & (hunger[:, None] >= _HUNGER_MIN)
+            & (energy[:, None] >= _ENERGY_MIN)
+            & (energy[:, None] <= _ENERGY_MAX)
+            & (arousal[:, None] >= _AROUSAL_MIN)
+            & (arousal[:, None] <= _AROUSAL_MAX)
+        )
+        first = matches.argmax(axis=1)
+        matched = matches[np.arange(len(first)), first]
+        emotions = np.where(matched, _EMOTIONS[first], EmotionType.CONTENT)
+
+        intensity_score = (
+            np.where((hunger > 80) | (hunger < 20), 0.3, 0.0)
+            + np.where((energy < 20) | (energy > 80), 0.2, 0.0)
+            + arousal * 0.3
+            + np.abs(mood - 50) / 50 * 0.2
+        )
+        levels = (
+            (intensity_score > 0.25).astype(np.intp)
+            + (intensity_score > 0.5)
+            + (intensity_score > 0.75)
+        )
+
+        return {
+            "emotion": emotions,
+            "intensity": _INTENSITY_LEVELS[levels],
+            "arousal": arousal,
+            "valence": (mood / 100 - 0.5) * 2,
+        }
+
+
+# EMOTION_THRESHOLDS flattened once into ordered rows with open bounds as +/-inf,
+# so determine_emotion does plain comparisons instead of per-key dict probes.
+_THRESHOLD_ROWS: tuple[tuple[EmotionType, float, float, float, float, float, float, float], ...] = tuple(
+    (
+        emotion,
+        thresholds.get("mood_min", -math.inf),
+        thresholds.get("mood_max", math.inf),
+        thresholds.get("hunger_min", -math.inf),
+        thresholds.get("energy_min", -math.inf),
+        thresholds.get("energy_max", math.inf),
+        thresholds.get("arousal_min", -math.inf),
+        thresholds.get("arousal_max", math.inf),
+    )
+    for emotion, thresholds in EmotionEngine.EMOTION_THRESHOLDS.items()
+)
+
+_EMOTIONS = np.array([row[0] for row in _THRESHOLD_ROWS], dtype=object)
+(
+    _MOOD_MIN,
+    _MOOD_MAX,
+    _HUNGER_MIN,
+    _ENERGY_MIN,
+    _ENERGY_MAX,
+    _AROUSAL_MIN,
+    _AROUSAL_MAX,
+) = np.array([row[1:] for row in _THRESHOLD_ROWS], dtype=np.float64).T
+
+_INTENSITY_LEVELS = np.array(
+    [
+        BehaviorIntensity.SUBTLE,
+        BehaviorIntensity.MODERATE,
+        BehaviorIntensity.STRONG,
+        BehaviorIntensity.INTENSE,
+    ],
+    dtype=object,
+)
+
+
+# Keyed on the exact inputs: binning would move values across the 0.3/0.4/0.5/0.7
+# arousal and inclusive mood/energy thresholds. Hits cost ~0.1us against ~1.7us
+# to classify, and repeated states (same vitals from idle polls) are common.
+@lru_cache(maxsize=4096)
+def _classify(
+    mood: float,
+    hunger: float,
+    energy: float,
+    arousal: float,
+) -> tuple[EmotionType, BehaviorIntensity]:
+    return (
+        EmotionEngine.determine_emotion(mood, hunger, energy, arousal),
+        EmotionEngine.calculate_intensity(mood, arousal, hunger, energy),
+    )
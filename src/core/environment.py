@@ -1,3 +1,4 @@
+from collections import deque
 from enum import IntEnum
 from typing import Any, Optional, SupportsFloat
 
@@ -5,6 +6,10 @@ import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
 
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
 
 class CatAction(IntEnum):
     IDLE = 0
@@ -86,45 +91,72 @@ class EnvConstants:
     NUM_ACTIONS: int = 8
 
 
+# Plain ints for the per-step action dispatch; comparing against IntEnum
+# members pays an enum attribute lookup per branch.
+_IDLE = int(CatAction.IDLE)
+_MOVE_TO_FOOD = int(CatAction.MOVE_TO_FOOD)
+_MOVE_TO_TOY = int(CatAction.MOVE_TO_TOY)
+_SLEEP = int(CatAction.SLEEP)
+_GROOM = int(CatAction.GROOM)
+_PLAY = int(CatAction.PLAY)
+_EXPLORE = int(CatAction.EXPLORE)
+_MEOW_AT_BOWL = int(CatAction.MEOW_AT_BOWL)
+
+# (low, high - low) for the initial hunger, energy and food/toy/bed distances in reset().
+_RESET_RANGES: tuple[tuple[float, float], ...] = tuple(
+    (low, high - low)
+    for low, high in (
+        (EnvConstants.INIT_HUNGER_MIN, EnvConstants.INIT_HUNGER_MAX),
+        (EnvConstants.INIT_ENERGY_MIN, EnvConstants.INIT_ENERGY_MAX),
+        (EnvConstants.MIN_DISTANCE, EnvConstants.MAX_DISTANCE),
+        (EnvConstants.MIN_DISTANCE, EnvConstants.MAX_DISTANCE),
+        (EnvConstants.MIN_DISTANCE, EnvConstants.MAX_DISTANCE),
+    )
+)
+_DISTANCE_SPAN: float = EnvConstants.MAX_DISTANCE - EnvConstants.MIN_DISTANCE
+_UNIFORM_POOL_SIZE: int = 256
+
+
 class CatEnvironment(gym.Env):
     metadata = {"render_modes": ["human"]}
 
+    # Shared by every instance: vec envs build many cats, and the spaces never change.
+    observation_space = spaces.Box(
+        low=np.array([
+            0.0,  # hunger
+            0.0,  # energy
+            0.0,  # distance_to_food
+            0.0,  # distance_to_toy
+            0.0,  # distance_to_bed
+            0.0,  # mood
+            EnvConstants.MIN_PERSONALITY_SCORE,  # lazy_score
+            EnvConstants.MIN_PERSONALITY_SCORE,  # foodie_score
+            EnvConstants.MIN_PERSONALITY_SCORE,  # playful_score
+            0.0,  # is_bowl_empty
+            0.0,  # is_bowl_tipped
+        ], dtype=np.float32),
+        high=np.array([
+            EnvConstants.MAX_HUNGER,
+            EnvConstants.MAX_ENERGY,
+            EnvConstants.MAX_DISTANCE,
+            EnvConstants.MAX_DISTANCE,
+            EnvConstants.MAX_DISTANCE,  # distance_to_bed
+            EnvConstants.MAX_MOOD,
+            EnvConstants.MAX_PERSONALITY_SCORE,  # lazy_score
+            EnvConstants.MAX_PERSONALITY_SCORE,  # foodie_score
+            EnvConstants.MAX_PERSONALITY_SCORE,  # playful_score
+            1.0,  # is_bowl_empty
+            1.0,  # is_bowl_tipped
+        ], dtype=np.float32),
+        dtype=np.float32,
+    )
+
+    action_space = spaces.Discrete(EnvConstants.NUM_ACTIONS)
+
     def __init__(self, render_mode: Optional[str] = None):
         super().__init__()
         self.render_mode = render_mode
 
-        self.observation_space = spaces.Box(
-            low=np.array([
-                0.0,  # hunger
-                0.0,  # energy
-                0.0,  # distance_to_food
-                0.0,  # distance_to_toy
-                0.0,  # distance_to_bed
-                0.0,  # mood
-                EnvConstants.MIN_PERSONALITY_SCORE,  # lazy_score
-                EnvConstants.MIN_PERSONALITY_SCORE,  # foodie_score
-                EnvConstants.MIN_PERSONALITY_SCORE,  # playful_score
-                0.0,  # is_bowl_empty
-                0.0,  # is_bowl_tipped
-            ]),
-            high=np.array([
-                EnvConstants.MAX_HUNGER,
-                EnvConstants.MAX_ENERGY,
-                EnvConstants.MAX_DISTANCE,
-                EnvConstants.MAX_DISTANCE,
-                EnvConstants.MAX_DISTANCE,  # distance_to_bed
-                EnvConstants.MAX_MOOD,
-                EnvConstants.MAX_PERSONALITY_SCORE,  # lazy_score
-                EnvConstants.MAX_PERSONALITY_SCORE,  # foodie_score
-                EnvConstants.MAX_PERSONALITY_SCORE,  # playful_score
-                1.0,  # is_bowl_empty
-                1.0,  # is_bowl_tipped
-            ]),
-            dtype=np.float32,
-        )
-
-        self.action_space = spaces.Discrete(EnvConstants.NUM_ACTIONS)
-
         self.hunger: float = 50.0
         self.energy: float = 50.0
         self.distance_to_food: float = 5.0
@@ -133,7 +165,8 @@ class CatEnvironment(gym.Env):
         self.mood: float = 50.0
         self.is_bowl_empty: bool = False
         self.is_bowl_tipped: bool = False
-        self.recent_rewards: list[float] = []
+        self.recent_rewards: deque[float] = deque(maxlen=EnvConstants.MOOD_HISTORY_WINDOW)
+        self._recent_reward_sum: float = 0.0
         self.personality_scores: dict[str, float] = {
             "lazy": 50.0,
             "foodie": 50.0,
@@ -141,6 +174,9 @@ class CatEnvironment(gym.Env):
         }
         self.steps: int = 0
         self.max_steps: int = EnvConstants.MAX_STEPS
+        self._obs = np.zeros(len(ObservationIndex), dtype=np.float32)
+        self._uniforms: list[float] = []
+        self._uniform_idx: int = 0
 
     def reset(
         self,
@@ -148,31 +184,24 @@ class CatEnvironment(gym.Env):
         options: Optional[dict[str, Any]] = None,
     ) -> tuple[np.ndarray, dict[str, Any]]:
         super().reset(seed=seed)
-
-        self.hunger = self.np_random.uniform(
-            EnvConstants.INIT_HUNGER_MIN,
-            EnvConstants.INIT_HUNGER_MAX,
-        )
-        self.energy = self.np_random.uniform(
-            EnvConstants.INIT_ENERGY_MIN,
-            EnvConstants.INIT_ENERGY_MAX,
-        )
-        self.distance_to_food = self.np_random.uniform(
-            EnvConstants.MIN_DISTANCE,
-            EnvConstants.MAX_DISTANCE,
-        )
-        self.distance_to_toy = self.np_random.uniform(
-            EnvConstants.MIN_DISTANCE,
-            EnvConstants.MAX_DISTANCE,
-        )
-        self.distance_to_bed = self.np_random.uniform(
-            EnvConstants.MIN_DISTANCE,
-            EnvConstants.MAX_DISTANCE,
-        )
+        if seed is not None:
+            # The pool was drawn from the previous generator.
+            self._uniforms = []
+            self._uniform_idx = 0
+
+        draw = self._next_uniform
+        (
+            self.hunger,
+            self.energy,
+            self.distance_to_food,
+            self.distance_to_toy,
+            self.distance_to_bed,
+        ) = (low + span * draw() for low, span in _RESET_RANGES)
         self.mood = 50.0
-        self.is_bowl_empty = self.np_random.random() < 0.2
-        self.is_bowl_tipped = self.np_random.random() < 0.1
-        self.recent_rewards = []
+        self.is_bowl_empty = draw() < 0.2
+        self.is_bowl_tipped = draw() < 0.1
+        self.recent_rewards.clear()
+        self._recent_reward_sum = 0.0
         self.personality_scores = {
             "lazy": 50.0,
             "foodie": 50.0,
@@ -180,53 +209,73 @@ class CatEnvironment(gym.Env):
         }
         self.steps = 0
 
+        # DummyVecEnv keeps the last step's array as info["terminal_observation"]
+        # and resets right after, so reset must not write into the step buffer.
         return self._get_observation(), {}
 
-    def _get_observation(self) -> np.ndarray:
-        return np.array(
-            [
-                self.hunger,
-                self.energy,
-                self.distance_to_food,
-                self.distance_to_toy,
-                self.distance_to_bed,
-                self.mood,
-                self.personality_scores["lazy"],
-                self.personality_scores["foodie"],
-                self.personality_scores["playful"],
-                1.0 if self.is_bowl_empty else 0.0,
-                1.0 if self.is_bowl_tipped else 0.0,
-            ],
-            dtype=np.float32,
+    def _get_observation(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        values = (
+            self.hunger,
+            self.energy,
+            self.distance_to_food,
+            self.distance_to_toy,
+            self.distance_to_bed,
+            self.mood,
+            self.personality_scores["lazy"],
+            self.personality_scores["foodie"],
+            self.personality_scores["playful"],
+            1.0 if self.is_bowl_empty else 0.0,
+            1.0 if self.is_bowl_tipped else 0.0,
         )
+        if out is None:
+            return np.array(values, dtype=np.float32)
+        out[:] = values
+        return out
+
+    def _next_uniform(self) -> float:
+        # Doubles are drawn in blocks but handed out in stream order, so episodes
+        # see the same values as one random() call per draw.
+        i = self._uniform_idx
+        if i == len(self._uniforms):
+            self._uniforms = self.np_random.random(_UNIFORM_POOL_SIZE).tolist()
+            i = 0
+        self._uniform_idx = i + 1
+        return self._uniforms[i]
 
     def _respawn_distance(self) -> float:
-        return self.np_random.uniform(
-            EnvConstants.MIN_DISTANCE,
-            EnvConstants.MAX_DISTANCE,
-        )
+        # Generator.uniform(low, high) is low + (high - low) * random().
+        return EnvConstants.MIN_DISTANCE + _DISTANCE_SPAN * self._next_uniform()
 
     def step(
         self,
         action: int,
     ) -> tuple[np.ndarray, SupportsFloat, bool, bool, dict[str, Any]]:
+        # Vec envs pass NumPy integers; compare as a plain int.
+        action = int(action)
         self.steps += 1
+        # Constants read on every step, bound once as fast locals.
+        max_hunger = EnvConstants.MAX_HUNGER
+        max_energy = EnvConstants.MAX_ENERGY
+        max_mood = EnvConstants.MAX_MOOD
+        critical_tired = EnvConstants.CRITICAL_TIRED_THRESHOLD
+        tired = EnvConstants.TIRED_THRESHOLD
+
         reward = EnvConstants.REWARD_STEP
         
-        critical_energy = self.energy < EnvConstants.CRITICAL_TIRED_THRESHOLD
-        low_energy = self.energy < EnvConstants.TIRED_THRESHOLD
+        critical_energy = self.energy < critical_tired
+        low_energy = self.energy < tired
         very_hungry = self.hunger < 20.0
         hungry = self.hunger < 30.0
 
-        hunger_deficit = EnvConstants.MAX_HUNGER - self.hunger
-        hunger_multiplier = 1.0 + (hunger_deficit / EnvConstants.MAX_HUNGER) * EnvConstants.HUNGER_DEGRADATION_FACTOR
+        hunger_deficit = max_hunger - self.hunger
+        hunger_multiplier = 1.0 + (hunger_deficit / max_hunger) * EnvConstants.HUNGER_DEGRADATION_FACTOR
         self.hunger -= EnvConstants.HUNGER_PER_STEP * hunger_multiplier
 
-        energy_deficit = EnvConstants.MAX_ENERGY - self.energy
-        energy_multiplier = 1.0 + (energy_deficit / EnvConstants.MAX_ENERGY) * EnvConstants.ENERGY_DEGRADATION_FACTOR
+        energy_deficit = max_energy - self.energy
+        energy_multiplier = 1.0 + (energy_deficit / max_energy) * EnvConstants.ENERGY_DEGRADATION_FACTOR
         self.energy -= EnvConstants.ENERGY_PER_STEP * energy_multiplier
 
-        if action == CatAction.MOVE_TO_FOOD:
+        if action == _MOVE_TO_FOOD:
             if critical_energy:
                 reward -= 20.0
             elif low_energy:
@@ -244,10 +293,10 @@ class CatEnvironment(gym.Env):
                     elif self.hunger > 60.0:
                         reward += EnvConstants.PENALTY_INEFFICIENT_ACTION
                     
-                    self.hunger = min(EnvConstants.MAX_HUNGER, self.hunger + EnvConstants.FOOD_HUNGER_REDUCTION)
+                    self.hunger = min(max_hunger, self.hunger + EnvConstants.FOOD_HUNGER_REDUCTION)
                     self.distance_to_food = self._respawn_distance()
 
-        elif action == CatAction.MOVE_TO_TOY:
+        elif action == _MOVE_TO_TOY:
             if critical_energy or low_energy or very_hungry:
                 reward -= 20.0
             else:
@@ -257,14 +306,14 @@ class CatEnvironment(gym.Env):
                         reward += EnvConstants.REWARD_PLAY * 2.0
                     self.distance_to_toy = self._respawn_distance()
 
-        elif action == CatAction.SLEEP:
+        elif action == _SLEEP:
             self.distance_to_bed -= EnvConstants.MOVE_DISTANCE
             
             if self.distance_to_bed <= 0:
                 energy_before = self.energy
                 
                 self.energy = min(
-                    EnvConstants.MAX_ENERGY,
+                    max_energy,
                     self.energy + EnvConstants.SLEEP_ENERGY_GAIN,
                 )
                 
@@ -273,10 +322,10 @@ class CatEnvironment(gym.Env):
                 if critical_energy:
                     reward += EnvConstants.REWARD_SLEEP_CRITICAL * 2.0
                     reward += actual_energy_gain * 2.0
-                elif self.energy < EnvConstants.CRITICAL_TIRED_THRESHOLD:
+                elif self.energy < critical_tired:
                     reward += EnvConstants.REWARD_SLEEP_CRITICAL
                     reward += actual_energy_gain * 1.5
-                elif self.energy < EnvConstants.TIRED_THRESHOLD:
+                elif self.energy < tired:
                     reward += EnvConstants.REWARD_SLEEP_TIRED
                     reward += actual_energy_gain * 1.0
                 elif self.energy < 60.0:
@@ -294,16 +343,16 @@ class CatEnvironment(gym.Env):
                 else:
                     reward -= 5.0
         
-        elif action == CatAction.GROOM:
+        elif action == _GROOM:
             if critical_energy or very_hungry:
                 reward -= 5.0
             else:
                 reward += 3.0
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 10.0)
+                self.mood = min(max_mood, self.mood + 10.0)
                 if self.mood > EnvConstants.GOOD_MOOD_THRESHOLD:
                     reward += 2.0
         
-        elif action == CatAction.PLAY:
+        elif action == _PLAY:
             if critical_energy or very_hungry:
                 reward -= 10.0
             elif low_energy or hungry:
@@ -311,11 +360,11 @@ class CatEnvironment(gym.Env):
             else:
                 self.energy -= 5.0
                 reward += EnvConstants.REWARD_PLAY * 2.0
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 15.0)
+                self.mood = min(max_mood, self.mood + 15.0)
                 if self.mood > EnvConstants.GOOD_MOOD_THRESHOLD:
                     reward += EnvConstants.GOOD_MOOD_PLAY_BONUS * 3.0
         
-        elif action == CatAction.EXPLORE:
+        elif action == _EXPLORE:
             if critical_energy or very_hungry:
                 reward -= 8.0
             elif low_energy:
@@ -323,9 +372,9 @@ class CatEnvironment(gym.Env):
             else:
                 self.energy -= 2.0
                 reward += 1.5
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 5.0)
+                self.mood = min(max_mood, self.mood + 5.0)
         
-        elif action == CatAction.IDLE:
+        elif action == _IDLE:
             if critical_energy:
                 reward -= 20.0
             elif very_hungry:
@@ -335,81 +384,75 @@ class CatEnvironment(gym.Env):
             else:
                 reward += 1.0
 
-        elif action == CatAction.MEOW_AT_BOWL:
+        elif action == _MEOW_AT_BOWL:
             if (self.is_bowl_empty or self.is_bowl_tipped) and very_hungry:
                 reward += 20.0
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 8.0)
+                self.mood = min(max_mood, self.mood + 8.0)
             elif (self.is_bowl_empty or self.is_bowl_tipped) and hungry:
                 reward += 12.0
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 5.0)
+                self.mood = min(max_mood, self.mood + 5.0)
             elif self.is_bowl_empty or self.is_bowl_tipped:
                 reward += 8.0
-                self.mood = min(EnvConstants.MAX_MOOD, self.mood + 3.0)
+                self.mood = min(max_mood, self.mood + 3.0)
             else:
                 reward -= 8.0
 
-        if self.energy < EnvConstants.CRITICAL_TIRED_THRESHOLD:
+        if self.energy < critical_tired:
             reward += EnvConstants.PENALTY_LOW_ENERGY * 3.0
-        elif self.energy < EnvConstants.TIRED_THRESHOLD:
+        elif self.energy < tired:
             reward += EnvConstants.PENALTY_LOW_ENERGY
 
-        self.hunger = np.clip(self.hunger, 0.0, EnvConstants.MAX_HUNGER)
-        self.energy = np.clip(self.energy, 0.0, EnvConstants.MAX_ENERGY)
-
-
-        self.recent_rewards.append(reward)
-        if len(self.recent_rewards) > EnvConstants.MOOD_HISTORY_WINDOW:
-            self.recent_rewards.pop(0)
+        # Inline clamps: np.clip on a Python float pays a full ufunc dispatch,
+        # and nested min/max builtin calls still cost ~5x a conditional.
+        hunger = self.hunger
+        self.hunger = 0.0 if hunger < 0.0 else (max_hunger if hunger > max_hunger else hunger)
+        energy = self.energy
+        self.energy = 0.0 if energy < 0.0 else (max_energy if energy > max_energy else energy)
+
+
+        # Running sum over the bounded window instead of np.mean on every step;
+        # the deque drops the oldest reward once it is full.
+        recent_rewards = self.recent_rewards
+        if len(recent_rewards) == recent_rewards.maxlen:
+            self._recent_reward_sum -= recent_rewards[0]
+        recent_rewards.append(reward)
+        self._recent_reward_sum += reward
         
-        avg_recent_reward = np.mean(self.recent_rewards) if self.recent_rewards else 0.0
+        avg_recent_reward = self._recent_reward_sum / len(recent_rewards)
         mood_delta = avg_recent_reward * EnvConstants.MOOD_REWARD_SCALE
         
 
         mood_decay = EnvConstants.MOOD_DECAY_BASE + (self.mood * EnvConstants.MOOD_DECAY_SCALE)
-        self.mood += float(mood_delta) - mood_decay
-        self.mood = np.clip(self.mood, 0.0, EnvConstants.MAX_MOOD)
+        mood = self.mood + (mood_delta - mood_decay)
+        self.mood = 0.0 if mood < 0.0 else (max_mood if mood > max_mood else mood)
         
 
-        if action == CatAction.MOVE_TO_TOY and self.mood > EnvConstants.GOOD_MOOD_THRESHOLD:
+        if action == _MOVE_TO_TOY and self.mood > EnvConstants.GOOD_MOOD_THRESHOLD:
             reward += EnvConstants.GOOD_MOOD_PLAY_BONUS
 
 
         drift_rate = EnvConstants.PERSONALITY_DRIFT_RATE
-        
-        if action == CatAction.SLEEP or action == CatAction.IDLE:
+        scores = self.personality_scores
 
-            self.personality_scores["lazy"] = min(
-                EnvConstants.MAX_PERSONALITY_SCORE,
-                self.personality_scores["lazy"] + drift_rate
-            )
-
-            self.personality_scores["playful"] = max(
+        if action == _SLEEP or action == _IDLE:
+            scores["lazy"] = min(EnvConstants.MAX_PERSONALITY_SCORE, scores["lazy"] + drift_rate)
+            scores["playful"] = max(
                 EnvConstants.MIN_PERSONALITY_SCORE,
-                self.personality_scores["playful"] - drift_rate * EnvConstants.PLAYFUL_DRIFT_REDUCTION
-            )
-        
-        if action == CatAction.MOVE_TO_FOOD:
-
-            self.personality_scores["foodie"] = min(
-                EnvConstants.MAX_PERSONALITY_SCORE,
-                self.personality_scores["foodie"] + drift_rate
-            )
-        
-        if action == CatAction.MOVE_TO_TOY:
-
-            self.personality_scores["playful"] = min(
-                EnvConstants.MAX_PERSONALITY_SCORE,
-                self.personality_scores["playful"] + drift_rate
+                scores["playful"] - drift_rate * EnvConstants.PLAYFUL_DRIFT_REDUCTION,
             )
-            self.personality_scores["lazy"] = max(
+        elif action == _MOVE_TO_FOOD:
+            scores["foodie"] = min(EnvConstants.MAX_PERSONALITY_SCORE, scores["foodie"] + drift_rate)
+        elif action == _MOVE_TO_TOY:
+            scores["playful"] = min(EnvConstants.MAX_PERSONALITY_SCORE, scores["playful"] + drift_rate)
+            scores["lazy"] = max(
                 EnvConstants.MIN_PERSONALITY_SCORE,
-                self.personality_scores["lazy"] - drift_rate * EnvConstants.LAZY_DRIFT_REDUCTION
+                scores["lazy"] - drift_rate * EnvConstants.LAZY_DRIFT_REDUCTION,
             )
 
         terminated = False
         truncated = False
 
-        if self.hunger >= EnvConstants.MAX_HUNGER:
+        if self.hunger >= max_hunger:
             reward += EnvConstants.REWARD_DEATH
             terminated = True
 
@@ -420,12 +463,11 @@ class CatEnvironment(gym.Env):
         if self.steps >= self.max_steps:
             truncated = True
 
-        return self._get_observation(), reward, terminated, truncated, {}
+        # Reused across steps; vec envs copy it into their own observation buffer.
+        return self._get_observation(self._obs), reward, terminated, truncated, {}
 
     def render(self) -> None:
         if self.render_mode == "human":
-            from src.utils.logger import get_logger
-            logger = get_logger(__name__)
             logger.info(
                 "env_state",
                 step=self.steps,
@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from enum import Enum
+from itertools import accumulate
 from typing import Optional
 import random
 
-import numpy as np
-
 from src.core.emotions import EmotionType, EmotionalState, BehaviorIntensity
 
 
@@ -40,6 +40,28 @@ class ReactionModifier:
     reaction_emotion: Optional[EmotionType] = None
     reaction_intensity: Optional[BehaviorIntensity] = None
     reaction_duration: float = 0.0
+    # Rules are static, so the action draw table is built once per modifier.
+    _actions: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+    _cumulative: tuple[float, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.action_probabilities:
+            self._actions = tuple(self.action_probabilities)
+            self._cumulative = tuple(accumulate(self.action_probabilities.values()))
+
+
+def _rule_table(
+    rules: dict[tuple[StimulusType, EmotionType], ReactionModifier],
+    fallbacks: dict[StimulusType, ReactionModifier],
+) -> dict[StimulusType, tuple[dict[EmotionType, ReactionModifier], Optional[ReactionModifier]]]:
+    # Enum.__hash__ runs in Python, so rules are grouped per stimulus with its
+    # fallback alongside; a lookup then hashes each enum once.
+    table: dict[StimulusType, tuple[dict[EmotionType, ReactionModifier], Optional[ReactionModifier]]] = {
+        stimulus: ({}, fallbacks.get(stimulus)) for stimulus in StimulusType
+    }
+    for (stimulus, emotion), reaction in rules.items():
+        table[stimulus][0][emotion] = reaction
+    return table
 
 
 class ReactionSystem:
@@ -217,18 +239,16 @@ class ReactionSystem:
             probability=0.5,
         ),
     }
+
+    _RULE_TABLE = _rule_table(REACTION_RULES, FALLBACK_REACTIONS)
     
     @staticmethod
     def get_reaction(
         stimulus: Stimulus,
         emotional_state: EmotionalState,
     ) -> Optional[ReactionModifier]:
-        key = (stimulus.type, emotional_state.primary_emotion)
-        
-        reaction = ReactionSystem.REACTION_RULES.get(key)
-        
-        if not reaction:
-            reaction = ReactionSystem.FALLBACK_REACTIONS.get(stimulus.type)
+        rules, fallback = ReactionSystem._RULE_TABLE[stimulus.type]
+        reaction = rules.get(emotional_state.primary_emotion, fallback)
         
         if not reaction:
             return None
@@ -250,12 +270,12 @@ class ReactionSystem:
         
         if reaction.action_probabilities:
             if random.random() < 0.8:
-                actions = list(reaction.action_probabilities.keys())
-                probabilities = list(reaction.action_probabilities.values())
-                
-                total = sum(probabilities)
-                normalized_probs = [p / total for p in probabilities]
-                
-                return np.random.choice(actions, p=normalized_probs)
+                actions = reaction._actions
+                cumulative = reaction._cumulative
+
+                # A uniform draw scaled by the total picks the same distribution as
+                # normalizing first; capping the index guards against rounding at the top.
+                index = bisect_right(cumulative, random.random() * cumulative[-1], 0, len(actions) - 1)
+                return actions[index]
         
         return base_action
@@ -0,0 +1,369 @@
+from typing import Any, Optional, Sequence
+
+import gymnasium as gym
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+from stable_baselines3.common.vec_env.base_vec_env import VecEnvIndices, VecEnvStepReturn
+
+from src.core.environment import (
+    CatAction,
+    CatEnvironment,
+    EnvConstants,
+    ObservationIndex,
+)
+
+_IDLE = int(CatAction.IDLE)
+_MOVE_TO_FOOD = int(CatAction.MOVE_TO_FOOD)
+_MOVE_TO_TOY = int(CatAction.MOVE_TO_TOY)
+_SLEEP = int(CatAction.SLEEP)
+_GROOM = int(CatAction.GROOM)
+_PLAY = int(CatAction.PLAY)
+_EXPLORE = int(CatAction.EXPLORE)
+_MEOW_AT_BOWL = int(CatAction.MEOW_AT_BOWL)
+
+_RESET_LOW = np.array([
+    EnvConstants.INIT_HUNGER_MIN,
+    EnvConstants.INIT_ENERGY_MIN,
+    EnvConstants.MIN_DISTANCE,
+    EnvConstants.MIN_DISTANCE,
+    EnvConstants.MIN_DISTANCE,
+])
+_RESET_SPAN = np.array([
+    EnvConstants.INIT_HUNGER_MAX,
+    EnvConstants.INIT_ENERGY_MAX,
+    EnvConstants.MAX_DISTANCE,
+    EnvConstants.MAX_DISTANCE,
+    EnvConstants.MAX_DISTANCE,
+]) - _RESET_LOW
+
+
+class BatchedCatEnvironment(VecEnv):
+    """N CatEnvironments stepped together as NumPy arrays.
+
+    Follows CatEnvironment.step branch for branch, applying each update
+    through the action masks in the same order, so a single env's
+    arithmetic is unchanged. Episodes auto-reset like DummyVecEnv.
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None):
+        self.render_mode = None
+        self._rng = np.random.default_rng(seed)
+
+        self.hunger = np.zeros(num_envs)
+        self.energy = np.zeros(num_envs)
+        self.distance_to_food = np.zeros(num_envs)
+        self.distance_to_toy = np.zeros(num_envs)
+        self.distance_to_bed = np.zeros(num_envs)
+        self.mood = np.zeros(num_envs)
+        self.lazy_score = np.zeros(num_envs)
+        self.foodie_score = np.zeros(num_envs)
+        self.playful_score = np.zeros(num_envs)
+        self.is_bowl_empty = np.zeros(num_envs, dtype=np.bool_)
+        self.is_bowl_tipped = np.zeros(num_envs, dtype=np.bool_)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.max_steps = EnvConstants.MAX_STEPS
+
+        # Rewards over the mood window; every env appends on every step, so one
+        # write position is shared and only the fill counts are per env.
+        self._reward_window = np.zeros((num_envs, EnvConstants.MOOD_HISTORY_WINDOW))
+        self._reward_sum = np.zeros(num_envs)
+        self._reward_count = np.zeros(num_envs, dtype=np.int64)
+        self._reward_pos = 0
+
+        self._actions = np.zeros(num_envs, dtype=np.int64)
+
+        super().__init__(num_envs, CatEnvironment.observation_space, CatEnvironment.action_space)
+
+    def reset(self) -> np.ndarray:
+        if self._seeds[0] is not None:
+            self._rng = np.random.default_rng(self._seeds[0])
+        self._reset_seeds()
+        self._reset_options()
+
+        self._reset_envs(np.ones(self.num_envs, dtype=np.bool_))
+        return self._get_observations()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        self._actions = np.asarray(actions, dtype=np.int64).reshape(self.num_envs)
+
+    def step_wait(self) -> VecEnvStepReturn:
+        reward, terminated, truncated = self._step(self._actions)
+        dones = terminated | truncated
+        obs = self._get_observations()
+        infos: list[dict[str, Any]] = [{} for _ in range(self.num_envs)]
+
+        if dones.any():
+            for i in np.flatnonzero(dones):
+                infos[i]["terminal_observation"] = obs[i].copy()
+                infos[i]["TimeLimit.truncated"] = bool(truncated[i] and not terminated[i])
+            self._reset_envs(dones)
+            obs[dones] = self._get_observations()[dones]
+
+        return obs, reward.astype(np.float32), dones, infos
+
+    def _reset_envs(self, mask: np.ndarray) -> None:
+        n = int(mask.sum())
+        initial = _RESET_LOW + _RESET_SPAN * self._rng.random((n, len(_RESET_LOW)))
+        self.hunger[mask] = initial[:, 0]
+        self.energy[mask] = initial[:, 1]
+        self.distance_to_food[mask] = initial[:, 2]
+        self.distance_to_toy[mask] = initial[:, 3]
+        self.distance_to_bed[mask] = initial[:, 4]
+        self.mood[mask] = 50.0
+        bowl_draws = self._rng.random((n, 2))
+        self.is_bowl_empty[mask] = bowl_draws[:, 0] < 0.2
+        self.is_bowl_tipped[mask] = bowl_draws[:, 1] < 0.1
+        self.lazy_score[mask] = 50.0
+        self.foodie_score[mask] = 50.0
+        self.playful_score[mask] = 50.0
+        self.steps[mask] = 0
+        self._reward_sum[mask] = 0.0
+        self._reward_count[mask] = 0
+
+    def _respawn_distances(self, n: int) -> np.ndarray:
+        return self._rng.uniform(EnvConstants.MIN_DISTANCE, EnvConstants.MAX_DISTANCE, size=n)
+
+    def _get_observations(self) -> np.ndarray:
+        obs = np.empty((self.num_envs, len(ObservationIndex)), dtype=np.float32)
+        obs[:, ObservationIndex.HUNGER] = self.hunger
+        obs[:, ObservationIndex.ENERGY] = self.energy
+        obs[:, ObservationIndex.DISTANCE_FOOD] = self.distance_to_food
+        obs[:, ObservationIndex.DISTANCE_TOY] = self.distance_to_toy
+        obs[:, ObservationIndex.DISTANCE_BED] = self.distance_to_bed
+        obs[:, ObservationIndex.MOOD] = self.mood
+        obs[:, ObservationIndex.LAZY_SCORE] = self.lazy_score
+        obs[:, ObservationIndex.FOODIE_SCORE] = self.foodie_score
+        obs[:, ObservationIndex.PLAYFUL_SCORE] = self.playful_score
+        obs[:, ObservationIndex.IS_BOWL_EMPTY] = self.is_bowl_empty
+        obs[:, ObservationIndex.IS_BOWL_TIPPED] = self.is_bowl_tipped
+        return obs
+
+    def _step(self, action: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        max_hunger = EnvConstants.MAX_HUNGER
+        max_energy = EnvConstants.MAX_ENERGY
+        max_mood = EnvConstants.MAX_MOOD
+        good_mood = EnvConstants.GOOD_MOOD_THRESHOLD
+        hunger = self.hunger
+        energy = self.energy
+        mood = self.mood
+
+        self.steps += 1
+        reward = np.full(self.num_envs, EnvConstants.REWARD_STEP)
+
+        critical_energy = energy < EnvConstants.CRITICAL_TIRED_THRESHOLD
+        low_energy = energy < EnvConstants.TIRED_THRESHOLD
+        very_hungry = hunger < 20.0
+        hungry = hunger < 30.0
+        bowl_blocked = self.is_bowl_empty | self.is_bowl_tipped
+
+        hunger -= EnvConstants.HUNGER_PER_STEP * (
+            1.0 + ((max_hunger - hunger) / max_hunger) * EnvConstants.HUNGER_DEGRADATION_FACTOR
+        )
+        energy -= EnvConstants.ENERGY_PER_STEP * (
+            1.0 + ((max_energy - energy) / max_energy) * EnvConstants.ENERGY_DEGRADATION_FACTOR
+        )
+
+        food = action == _MOVE_TO_FOOD
+        if food.any():
+            reward[food & critical_energy] -= 20.0
+            reward[food & low_energy & ~critical_energy] -= 10.0
+            reward[food & bowl_blocked] -= 15.0
+            walking = food & ~bowl_blocked
+            self.distance_to_food[walking] -= EnvConstants.MOVE_DISTANCE
+            arrived = walking & (self.distance_to_food <= 0)
+            if arrived.any():
+                reward[arrived & very_hungry] += EnvConstants.REWARD_EAT_HUNGRY * 1.5
+                reward[arrived & hungry & ~very_hungry] += EnvConstants.REWARD_EAT_HUNGRY
+                reward[arrived & ~hungry & (hunger > 60.0)] += EnvConstants.PENALTY_INEFFICIENT_ACTION
+                hunger[arrived] = np.minimum(
+                    max_hunger, hunger[arrived] + EnvConstants.FOOD_HUNGER_REDUCTION
+                )
+                self.distance_to_food[arrived] = self._respawn_distances(int(arrived.sum()))
+
+        toy = action == _MOVE_TO_TOY
+        if toy.any():
+            blocked = toy & (critical_energy | low_energy | very_hungry)
+            reward[blocked] -= 20.0
+            walking = toy & ~blocked
+            self.distance_to_toy[walking] -= EnvConstants.MOVE_DISTANCE
+            arrived = walking & (self.distance_to_toy <= 0)
+            if arrived.any():
+                reward[
+                    arrived & (hunger > 40.0) & (energy > EnvConstants.PLAY_ENERGY_THRESHOLD)
+                ] += EnvConstants.REWARD_PLAY * 2.0
+                self.distance_to_toy[arrived] = self._respawn_distances(int(arrived.sum()))
+
+        sleep = action == _SLEEP
+        if sleep.any():
+            self.distance_to_bed[sleep] -= EnvConstants.MOVE_DISTANCE
+            in_bed = sleep & (self.distance_to_bed <= 0)
+            if in_bed.any():
+                energy_before = energy.copy()
+                energy[in_bed] = np.minimum(
+                    max_energy, energy[in_bed] + EnvConstants.SLEEP_ENERGY_GAIN
+                )
+                gain = energy - energy_before
+
+                was_critical = in_bed & critical_energy
+                now_critical = in_bed & ~critical_energy & (energy < EnvConstants.CRITICAL_TIRED_THRESHOLD)
+                now_tired = (
+                    in_bed & ~critical_energy & ~now_critical & (energy < EnvConstants.TIRED_THRESHOLD)
+                )
+                rested = in_bed & ~(was_critical | now_critical | now_tired)
+                below_60 = rested & (energy < 60.0)
+
+                reward[was_critical] += EnvConstants.REWARD_SLEEP_CRITICAL * 2.0
+                reward[was_critical] += gain[was_critical] * 2.0
+                reward[now_critical] += EnvConstants.REWARD_SLEEP_CRITICAL
+                reward[now_critical] += gain[now_critical] * 1.5
+                reward[now_tired] += EnvConstants.REWARD_SLEEP_TIRED
+                reward[now_tired] += gain[now_tired] * 1.0
+                reward[below_60] += gain[below_60] * 0.3
+                reward[rested & ~below_60] -= 15.0
+                reward[in_bed & very_hungry] -= 20.0
+                self.distance_to_bed[in_bed] = self._respawn_distances(int(in_bed.sum()))
+
+            walking = sleep & ~in_bed
+            reward[walking & (low_energy | critical_energy)] += 2.0
+            reward[walking & ~(low_energy | critical_energy)] -= 5.0
+
+        groom = action == _GROOM
+        if groom.any():
+            blocked = groom & (critical_energy | very_hungry)
+            reward[blocked] -= 5.0
+            grooming = groom & ~blocked
+            reward[grooming] += 3.0
+            mood[grooming] = np.minimum(max_mood, mood[grooming] + 10.0)
+            reward[grooming & (mood > good_mood)] += 2.0
+
+        play = action == _PLAY
+        if play.any():
+            blocked = play & (critical_energy | very_hungry)
+            reluctant = play & ~blocked & (low_energy | hungry)
+            playing = play & ~blocked & ~reluctant
+            reward[blocked] -= 10.0
+            reward[reluctant] -= 5.0
+            energy[playing] -= 5.0
+            reward[playing] += EnvConstants.REWARD_PLAY * 2.0
+            mood[playing] = np.minimum(max_mood, mood[playing] + 15.0)
+            reward[playing & (mood > good_mood)] += EnvConstants.GOOD_MOOD_PLAY_BONUS * 3.0
+
+        explore = action == _EXPLORE
+        if explore.any():
+            blocked = explore & (critical_energy | very_hungry)
+            reluctant = explore & ~blocked & low_energy
+            exploring = explore & ~blocked & ~reluctant
+            reward[blocked] -= 8.0
+            reward[reluctant] -= 3.0
+            energy[exploring] -= 2.0
+            reward[exploring] += 1.5
+            mood[exploring] = np.minimum(max_mood, mood[exploring] + 5.0)
+
+        idle = action == _IDLE
+        if idle.any():
+            reward[idle & critical_energy] -= 20.0
+            reward[idle & ~critical_energy & very_hungry] -= 15.0
+            uneasy = idle & ~critical_energy & ~very_hungry
+            reward[uneasy & (low_energy | hungry)] -= 10.0
+            reward[uneasy & ~(low_energy | hungry)] += 1.0
+
+        meow = action == _MEOW_AT_BOWL
+        if meow.any():
+            desperate = meow & bowl_blocked & very_hungry
+            needy = meow & bowl_blocked & ~very_hungry & hungry
+            asking = meow & bowl_blocked & ~very_hungry & ~hungry
+            reward[desperate] += 20.0
+            mood[desperate] = np.minimum(max_mood, mood[desperate] + 8.0)
+            reward[needy] += 12.0
+            mood[needy] = np.minimum(max_mood, mood[needy] + 5.0)
+            reward[asking] += 8.0
+            mood[asking] = np.minimum(max_mood, mood[asking] + 3.0)
+            reward[meow & ~bowl_blocked] -= 8.0
+
+        exhausted = energy < EnvConstants.CRITICAL_TIRED_THRESHOLD
+        reward[exhausted] += EnvConstants.PENALTY_LOW_ENERGY * 3.0
+        reward[~exhausted & (energy < EnvConstants.TIRED_THRESHOLD)] += EnvConstants.PENALTY_LOW_ENERGY
+
+        np.clip(hunger, 0.0, max_hunger, out=hunger)
+        np.clip(energy, 0.0, max_energy, out=energy)
+
+        # Running window sum, evicting the reward written MOOD_HISTORY_WINDOW steps ago.
+        pos = self._reward_pos
+        full = self._reward_count == EnvConstants.MOOD_HISTORY_WINDOW
+        self._reward_sum[full] -= self._reward_window[full, pos]
+        self._reward_window[:, pos] = reward
+        self._reward_sum += reward
+        self._reward_count[~full] += 1
+        self._reward_pos = (pos + 1) % EnvConstants.MOOD_HISTORY_WINDOW
+
+        mood_delta = (self._reward_sum / self._reward_count) * EnvConstants.MOOD_REWARD_SCALE
+        mood_decay = EnvConstants.MOOD_DECAY_BASE + (mood * EnvConstants.MOOD_DECAY_SCALE)
+        mood += mood_delta - mood_decay
+        np.clip(mood, 0.0, max_mood, out=mood)
+
+        reward[toy & (mood > good_mood)] += EnvConstants.GOOD_MOOD_PLAY_BONUS
+
+        drift_rate = EnvConstants.PERSONALITY_DRIFT_RATE
+        resting = sleep | idle
+        self.lazy_score[resting] = np.minimum(
+            EnvConstants.MAX_PERSONALITY_SCORE, self.lazy_score[resting] + drift_rate
+        )
+        self.playful_score[resting] = np.maximum(
+            EnvConstants.MIN_PERSONALITY_SCORE,
+            self.playful_score[resting] - drift_rate * EnvConstants.PLAYFUL_DRIFT_REDUCTION,
+        )
+        self.foodie_score[food] = np.minimum(
+            EnvConstants.MAX_PERSONALITY_SCORE, self.foodie_score[food] + drift_rate
+        )
+        self.playful_score[toy] = np.minimum(
+            EnvConstants.MAX_PERSONALITY_SCORE, self.playful_score[toy] + drift_rate
+        )
+        self.lazy_score[toy] = np.maximum(
+            EnvConstants.MIN_PERSONALITY_SCORE,
+            self.lazy_score[toy] - drift_rate * EnvConstants.LAZY_DRIFT_REDUCTION,
+        )
+
+        starved = hunger >= max_hunger
+        collapsed = energy <= 0
+        reward[starved] += EnvConstants.REWARD_DEATH
+        reward[collapsed] += EnvConstants.REWARD_DEATH / 2
+
+        return reward, starved | collapsed, self.steps >= self.max_steps
+
+    def close(self) -> None:
+        pass
+
+    def get_attr(self, attr_name: str, indices: VecEnvIndices = None) -> list[Any]:
+        value = getattr(self, attr_name)
+        return [value for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices: VecEnvIndices = None) -> None:
+        # Attributes live on the batch, so a write always reaches every env.
+        if set(self._get_indices(indices)) != set(range(self.num_envs)):
+            raise ValueError(
+                f"{attr_name!r} is shared by all batched envs; set it without indices"
+            )
+        setattr(self, attr_name, value)
+
+    def env_method(
+        self,
+        method_name: str,
+        *method_args,
+        indices: VecEnvIndices = None,
+        **method_kwargs,
+    ) -> list[Any]:
+        raise AttributeError(f"BatchedCatEnvironment has no per-env method {method_name!r}")
+
+    def env_is_wrapped(
+        self,
+        wrapper_class: type[gym.Wrapper],
+        indices: VecEnvIndices = None,
+    ) -> list[bool]:
+        return [False for _ in self._get_indices(indices)]
+
+    def _get_indices(self, indices: VecEnvIndices) -> Sequence[int]:
+        if indices is None:
+            return range(self.num_envs)
+        if isinstance(indices, int):
+            return [indices]
+        return indices
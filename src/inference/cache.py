@@ -1,5 +1,5 @@
 import hashlib
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
 
@@ -9,7 +9,10 @@ from src.utils.logger import get_logger
 logger = get_logger(__name__)
 
 HASH_DECIMALS: int = 3
-HASH_LENGTH: int = 16
+# Observations are keyed by their thousandths as int32; int16 would overflow above 32.767.
+HASH_SCALE: float = 10.0**HASH_DECIMALS
+# blake2b with an 8-byte digest gives the same 16 hex chars as the old truncated sha256.
+HASH_DIGEST_SIZE: int = 8
 CACHE_KEY_PREFIX: str = "cat_action"
 
 
@@ -32,9 +35,8 @@ class PredictionCache:
                 self.enabled = False
 
     def _hash_observation(self, observation: np.ndarray) -> str:
-        rounded = np.round(observation, decimals=HASH_DECIMALS)
-        obs_bytes = rounded.tobytes()
-        return hashlib.sha256(obs_bytes).hexdigest()[:HASH_LENGTH]
+        obs_bytes = np.rint(observation * HASH_SCALE).astype(np.int32).tobytes()
+        return hashlib.blake2b(obs_bytes, digest_size=HASH_DIGEST_SIZE).hexdigest()
 
     async def get(self, observation: np.ndarray) -> Optional[int]:
         if not self.enabled or self.redis is None:
@@ -60,5 +62,30 @@ class PredictionCache:
         except Exception as e:
             logger.warning("cache_set_error", error=str(e))
 
+    async def get_many(self, observations: Sequence[np.ndarray]) -> list[Optional[int]]:
+        if not self.enabled or self.redis is None or not observations:
+            return [None] * len(observations)
+
+        try:
+            keys = [f"{CACHE_KEY_PREFIX}:{self._hash_observation(obs)}" for obs in observations]
+            return [None if cached is None else int(cached) for cached in self.redis.mget(keys)]
+        except Exception as e:
+            logger.warning("cache_get_error", error=str(e))
+
+        return [None] * len(observations)
+
+    async def set_many(self, observations: Sequence[np.ndarray], actions: Sequence[int]) -> None:
+        if not self.enabled or self.redis is None or not observations:
+            return
+
+        try:
+            # One round trip; MSET has no per-key TTL, so the SETEXs are pipelined.
+            pipe = self.redis.pipeline(transaction=False)
+            for obs, action in zip(observations, actions):
+                pipe.setex(f"{CACHE_KEY_PREFIX}:{self._hash_observation(obs)}", self.ttl, str(action))
+            pipe.execute()
+        except Exception as e:
+            logger.warning("cache_set_error", error=str(e))
+
     def is_available(self) -> bool:
         return self.enabled and self.redis is not None
@@ -0,0 +1,43 @@
+from typing import Optional
+
+import numpy as np
+import torch
+from gymnasium import spaces
+from stable_baselines3 import PPO
+from stable_baselines3.common.policies import ActorCriticPolicy
+
+
+class GreedyPolicy:
+    """Deterministic batch actions straight from a PPO actor.
+
+    For a Discrete action space the deterministic action is the mode of the
+    categorical distribution, so SB3's per-call observation checks,
+    distribution object and value head can all be skipped.
+    """
+
+    def __init__(self, model: PPO):
+        self.policy: ActorCriticPolicy = model.policy
+        self.device = model.device
+        self.policy.set_training_mode(False)
+
+    def predict(self, observations: np.ndarray) -> np.ndarray:
+        policy = self.policy
+        with torch.inference_mode():
+            obs = torch.as_tensor(observations, dtype=torch.float32, device=self.device)
+            features = policy.extract_features(obs, policy.pi_features_extractor)
+            logits = policy.action_net(policy.mlp_extractor.forward_actor(features))
+            # Same normalize-then-softmax as torch's Categorical, so near-ties that
+            # round to equal probabilities resolve exactly as SB3's mode does.
+            probs = torch.softmax(logits - logits.logsumexp(dim=1, keepdim=True), dim=1)
+            return probs.argmax(dim=1).cpu().numpy()
+
+
+def greedy_policy_for(model: PPO) -> Optional[GreedyPolicy]:
+    if (
+        isinstance(model, PPO)
+        and isinstance(model.policy, ActorCriticPolicy)
+        and isinstance(model.action_space, spaces.Discrete)
+        and isinstance(model.observation_space, spaces.Box)
+    ):
+        return GreedyPolicy(model)
+    return None
@@ -1,4 +1,5 @@
 import json
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +12,7 @@ logger = get_logger(__name__)
 
 EXCLUDED_DIRS: set[str] = {"checkpoints", "tensorboard"}
 DEFAULT_BRAIN_KEY: str = "__default__"
+METADATA_RECHECK_INTERVAL: float = 1.0
 
 
 class ModelLoader:
@@ -18,7 +20,8 @@ class ModelLoader:
         self.config = config
         self.model_path = Path(config.MODEL_PATH)
         self.models: dict[str, PPO] = {}
-        self.metadata_cache: dict[str, dict] = {}
+        self.metadata_cache: dict[str, tuple[float, int, dict]] = {}
+        self._versions_cache: Optional[tuple[int, list[str]]] = None
         self.default_version = config.MODEL_VERSION
 
     def load_model(self, version: str = "latest", cat_id: Optional[str] = None) -> PPO:
@@ -45,6 +48,7 @@ class ModelLoader:
         try:
             model = PPO.load(str(model_file))
             self.models[model_key] = model
+            self._versions_cache = None
 
             logger.info(
                 "model_loaded",
@@ -74,13 +78,17 @@ class ModelLoader:
         return None
 
     def get_model_info(self, version: str = "latest") -> dict:
-        if version in self.metadata_cache:
-            return self.metadata_cache[version]
+        now = time.monotonic()
+        cached = self.metadata_cache.get(version)
+        if cached is not None and now - cached[0] < METADATA_RECHECK_INTERVAL:
+            return cached[2]
 
-        version_path = self.model_path / version
-        metadata_file = version_path / "metadata.json"
+        metadata_file = self.model_path / version / "metadata.json"
 
-        if not metadata_file.exists():
+        try:
+            mtime_ns = metadata_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.metadata_cache.pop(version, None)
             return {
                 "version": version,
                 "trained_at": "unknown",
@@ -88,24 +96,33 @@ class ModelLoader:
                 "mean_reward": 0.0,
             }
 
-        with open(metadata_file) as f:
-            metadata = json.load(f)
+        if cached is not None and cached[1] == mtime_ns:
+            metadata = cached[2]
+        else:
+            with open(metadata_file) as f:
+                metadata = json.load(f)
 
-        self.metadata_cache[version] = metadata
+        self.metadata_cache[version] = (now, mtime_ns, metadata)
         return metadata
 
     def list_versions(self) -> list[str]:
-        versions: list[str] = []
+        try:
+            dir_mtime = self.model_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
 
-        if not self.model_path.exists():
-            return versions
+        if self._versions_cache is not None and self._versions_cache[0] == dir_mtime:
+            return list(self._versions_cache[1])
 
+        versions: list[str] = []
         for item in self.model_path.iterdir():
             if item.is_dir() and (item / "cat_brain.zip").exists():
                 if item.name not in EXCLUDED_DIRS:
                     versions.append(item.name)
 
-        return sorted(versions, reverse=True)
+        versions.sort(reverse=True)
+        self._versions_cache = (dir_mtime, versions)
+        return list(versions)
 
     def unload_model(self, version: str) -> None:
         if version in self.models:
@@ -116,6 +133,7 @@ class ModelLoader:
         self.unload_model(version)
         if version in self.metadata_cache:
             del self.metadata_cache[version]
+        self._versions_cache = None
         return self.load_model(version)
     
     def load_model_for_cat(self, cat_id: str) -> PPO:
@@ -1,15 +1,19 @@
 import asyncio
+import queue
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
 from src.core.config import Settings, PERSONALITY_CONFIG
 from src.core.environment import EnvConstants, ObservationIndex
 from src.inference.cache import PredictionCache
+from src.inference.greedy_policy import GreedyPolicy, greedy_policy_for
 from src.inference.model_loader import ModelLoader
 from src.utils.action_history import ActionHistory
 from src.utils.logger import get_logger
+from src.utils.metrics import BATCH_SIZE_HISTOGRAM
 from src.services.cat_profile_store import CatProfileStore, CatProfile
 
 logger = get_logger(__name__)
@@ -24,40 +28,43 @@ class PersonalityModifier:
     Mood and personality scores remain unchanged.
     """
     
+    # Hunger, energy and the three distances are contiguous at the front of the
+    # observation, so each personality is one multiplier vector over that slice.
+    _SCALED = slice(ObservationIndex.HUNGER, ObservationIndex.DISTANCE_BED + 1)
+    _MULTIPLIERS: dict[str, np.ndarray] = {
+        name: np.array(
+            [
+                mods["hunger"],
+                mods["energy"],
+                mods["distance_food"],
+                mods["distance_toy"],
+                mods.get("distance_bed", 1.0),
+            ],
+            dtype=np.float32,
+        )
+        for name, mods in PERSONALITY_CONFIG.items()
+    }
+    _UPPER = np.array(
+        [
+            EnvConstants.MAX_HUNGER,
+            EnvConstants.MAX_ENERGY,
+            EnvConstants.MAX_DISTANCE,
+            EnvConstants.MAX_DISTANCE,
+            EnvConstants.MAX_DISTANCE,
+        ],
+        dtype=np.float32,
+    )
+
     @staticmethod
     def apply(observation: np.ndarray, personality: str) -> np.ndarray:
-        if personality not in PERSONALITY_CONFIG:
+        multipliers = PersonalityModifier._MULTIPLIERS.get(personality)
+        if multipliers is None:
             return observation
-        
-        mods = PERSONALITY_CONFIG[personality]
-        modified = observation.copy()
-        
-
-        modified[ObservationIndex.HUNGER] *= mods["hunger"]
-        modified[ObservationIndex.ENERGY] *= mods["energy"]
-        modified[ObservationIndex.DISTANCE_FOOD] *= mods["distance_food"]
-        modified[ObservationIndex.DISTANCE_TOY] *= mods["distance_toy"]
-        modified[ObservationIndex.DISTANCE_BED] *= mods.get("distance_bed", 1.0)
-        
 
-        
-
-        modified[ObservationIndex.HUNGER] = np.clip(
-            modified[ObservationIndex.HUNGER], 0, EnvConstants.MAX_HUNGER
-        )
-        modified[ObservationIndex.ENERGY] = np.clip(
-            modified[ObservationIndex.ENERGY], 0, EnvConstants.MAX_ENERGY
-        )
-        modified[ObservationIndex.DISTANCE_FOOD] = np.clip(
-            modified[ObservationIndex.DISTANCE_FOOD], 0, EnvConstants.MAX_DISTANCE
-        )
-        modified[ObservationIndex.DISTANCE_TOY] = np.clip(
-            modified[ObservationIndex.DISTANCE_TOY], 0, EnvConstants.MAX_DISTANCE
-        )
-        modified[ObservationIndex.DISTANCE_BED] = np.clip(
-            modified[ObservationIndex.DISTANCE_BED], 0, EnvConstants.MAX_DISTANCE
-        )
-        
+        modified = observation.copy()
+        scaled = modified[PersonalityModifier._SCALED]
+        scaled *= multipliers
+        np.clip(scaled, 0, PersonalityModifier._UPPER, out=scaled)
         return modified
 
 
@@ -74,7 +81,11 @@ class ProfileModifier:
             if key not in mods:
                 return
             modified[index] *= mods[key]
-            modified[index] = np.clip(modified[index], 0, max_value)
+            value = modified[index]
+            if value < 0.0:
+                modified[index] = 0.0
+            elif value > max_value:
+                modified[index] = max_value
 
         scale(ObservationIndex.HUNGER, EnvConstants.MAX_HUNGER, "hunger")
         scale(ObservationIndex.ENERGY, EnvConstants.MAX_ENERGY, "energy")
@@ -89,6 +100,15 @@ class ProfileModifier:
         return modified
 
 
+def _resolve(future: asyncio.Future, result: Optional[np.ndarray], error: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
 @dataclass
 class PredictionRequest:
     observation: np.ndarray
@@ -114,15 +134,32 @@ class BatchPredictor:
         self.cache = PredictionCache(config)
         self._processor_task: Optional[asyncio.Task[None]] = None
         self._running = False
+        # Batches go to one long-lived inference thread rather than a fresh
+        # asyncio.to_thread executor hop per batch.
+        self._inference_jobs: Optional[queue.SimpleQueue] = None
+        # The loaded model paired with its greedy actor, rebuilt when the loader
+        # hands back a different model (e.g. after a reload).
+        self._greedy: tuple[object, Optional[GreedyPolicy]] = (None, None)
 
     def start(self) -> None:
         if self._processor_task is None or self._processor_task.done():
             self._running = True
+            if self._inference_jobs is None:
+                self._inference_jobs = queue.SimpleQueue()
+                threading.Thread(
+                    target=self._inference_loop,
+                    args=(self._inference_jobs,),
+                    name="batch-inference",
+                    daemon=True,
+                ).start()
             self._processor_task = asyncio.create_task(self._batch_processor())
             logger.info("batch_processor_started")
 
     def stop(self) -> None:
         self._running = False
+        if self._inference_jobs is not None:
+            self._inference_jobs.put(None)
+            self._inference_jobs = None
         if self._processor_task:
             self._processor_task.cancel()
             logger.info("batch_processor_stopped")
@@ -134,24 +171,14 @@ class BatchPredictor:
         personality: str = "balanced",
         use_cache: bool = True,
     ) -> int:
-        profile = None
-        if cat_id and self.profile_store is not None:
-            profile = self.profile_store.ensure_profile(cat_id, personality)
+        modified_obs = self._modify_observation(observation, cat_id, personality)
 
-        modified_obs = PersonalityModifier.apply(observation, personality)
-        modified_obs = ProfileModifier.apply(modified_obs, profile)
-        
         if use_cache:
             cached = await self.cache.get(modified_obs)
             if cached is not None:
                 return cached
 
-        model = self.model_loader.get_model(self.config.MODEL_VERSION, cat_id)
-        if model is None:
-            model = self.model_loader.load_model(self.config.MODEL_VERSION, cat_id)
-
-        action, _ = model.predict(modified_obs, deterministic=True)
-        action_int = int(action)
+        action_int = await self.submit(modified_obs)
 
         if use_cache:
             await self.cache.set(modified_obs, action_int)
@@ -162,12 +189,58 @@ class BatchPredictor:
 
         return action_int
 
-    async def predict_batch(self, states: list[tuple[np.ndarray, Optional[str], str]]) -> list[int]:
-        tasks = [
-            self.predict_single(obs, cat_id=cat_id, personality=personality)
+    async def predict_batch(
+        self,
+        states: Union[np.ndarray, list[tuple[np.ndarray, Optional[str], str]]],
+    ) -> list[int]:
+        if isinstance(states, np.ndarray) and states.ndim == 2:
+            states = [(row, None, "balanced") for row in states]
+
+        modified = [
+            self._modify_observation(obs, cat_id, personality)
             for obs, cat_id, personality in states
         ]
-        return await asyncio.gather(*tasks)
+        # One MGET and one pipelined write for the whole batch instead of a
+        # Redis round trip per state.
+        actions = await self.cache.get_many(modified)
+        misses = [i for i, action in enumerate(actions) if action is None]
+        if not misses:
+            return actions
+
+        predicted = await asyncio.gather(*(self.submit(modified[i]) for i in misses))
+        await self.cache.set_many([modified[i] for i in misses], predicted)
+
+        for i, action_int in zip(misses, predicted):
+            actions[i] = action_int
+            cat_id = states[i][1]
+            if self.action_history and cat_id:
+                self.action_history.log_action(cat_id, modified[i], action_int)
+
+        return actions
+
+    def _modify_observation(
+        self,
+        observation: np.ndarray,
+        cat_id: Optional[str],
+        personality: str,
+    ) -> np.ndarray:
+        profile = None
+        if cat_id and self.profile_store is not None:
+            profile = self.profile_store.ensure_profile(cat_id, personality)
+
+        modified_obs = PersonalityModifier.apply(observation, personality)
+        modified_obs = ProfileModifier.apply(modified_obs, profile)
+        if modified_obs is observation:
+            modified_obs = observation.copy()
+        return modified_obs
+
+    async def submit(self, observation: np.ndarray) -> int:
+        if not self._running:
+            return int(self._predict_sync(observation[np.newaxis])[0])
+
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        await self.batch_queue.put(PredictionRequest(observation=observation, future=future))
+        return await future
 
     async def _batch_processor(self) -> None:
         while self._running:
@@ -209,8 +282,9 @@ class BatchPredictor:
     async def _process_batch(self, requests: list[PredictionRequest]) -> None:
         try:
             observations = np.array([r.observation for r in requests])
+            BATCH_SIZE_HISTOGRAM.observe(len(requests))
 
-            actions = await asyncio.to_thread(self._predict_sync, observations)
+            actions = await self._infer(observations)
 
             for request, action in zip(requests, actions):
                 if not request.future.done():
@@ -222,10 +296,42 @@ class BatchPredictor:
                 if not request.future.done():
                     request.future.set_exception(e)
 
+    async def _infer(self, observations: np.ndarray) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        self._inference_jobs.put((observations, loop, future))
+        return await future
+
+    def _inference_loop(self, jobs: queue.SimpleQueue) -> None:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+
+            observations, loop, future = job
+            try:
+                result, error = self._predict_sync(observations), None
+            except Exception as e:
+                result, error = None, e
+
+            try:
+                loop.call_soon_threadsafe(_resolve, future, result, error)
+            except RuntimeError:
+                # The event loop closed while the batch was running.
+                pass
+
     def _predict_sync(self, observations: np.ndarray) -> np.ndarray:
         model = self.model_loader.get_model(self.config.MODEL_VERSION)
         if model is None:
             model = self.model_loader.load_model(self.config.MODEL_VERSION)
 
+        built_from, greedy = self._greedy
+        if built_from is not model:
+            greedy = greedy_policy_for(model)
+            self._greedy = (model, greedy)
+
+        if greedy is not None:
+            return greedy.predict(observations)
+
         actions, _ = model.predict(observations, deterministic=True)
         return actions
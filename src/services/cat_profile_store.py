@@ -49,9 +49,18 @@ class CatProfileStore:
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
         self._cache: dict[str, CatProfile] = {}
+        self._profile_paths: dict[str, Path] = {}
+        self._known_ids: set[str] = {
+            path.parent.name for path in self.base_path.glob("*/profile.json")
+        }
 
     def profile_exists(self, cat_id: str) -> bool:
-        return self._get_profile_path(cat_id).exists()
+        if cat_id in self._known_ids:
+            return True
+        if self._get_profile_path(cat_id).exists():
+            self._known_ids.add(cat_id)
+            return True
+        return False
 
     def get_profile(self, cat_id: str) -> Optional[CatProfile]:
         cached = self._cache.get(cat_id)
@@ -62,9 +71,9 @@ class CatProfileStore:
             upgraded = self._upgrade_profile_if_needed(cached, profile_path)
             self._cache[cat_id] = upgraded
             return upgraded
-        profile_path = self._get_profile_path(cat_id)
-        if not profile_path.exists():
+        if not self.profile_exists(cat_id):
             return None
+        profile_path = self._get_profile_path(cat_id)
         try:
             with open(profile_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
@@ -78,7 +87,7 @@ class CatProfileStore:
 
     def create_profile(self, cat_id: str, personality: str) -> CatProfile:
         profile_path = self._get_profile_path(cat_id)
-        if profile_path.exists():
+        if self.profile_exists(cat_id):
             raise FileExistsError(f"Profile for {cat_id} already exists")
 
         profile_path.parent.mkdir(parents=True, exist_ok=True)
@@ -94,6 +103,7 @@ class CatProfileStore:
         )
         self._save_profile(profile, profile_path)
         self._cache[cat_id] = profile
+        self._known_ids.add(cat_id)
         logger.info("cat_profile_created", cat_id=cat_id, path=str(profile_path))
         return profile
 
@@ -115,7 +125,14 @@ class CatProfileStore:
             raise
 
     def _get_profile_path(self, cat_id: str) -> Path:
-        return self.base_path / cat_id / "profile.json"
+        path = self._profile_paths.get(cat_id)
+        if path is None:
+            path = self.base_path / cat_id / "profile.json"
+            # Only ids with a profile on disk are memoized, so lookups for
+            # arbitrary client-supplied ids can't grow this dict.
+            if cat_id in self._known_ids:
+                self._profile_paths[cat_id] = path
+        return path
 
     def _seed_from_cat_id(self, cat_id: str) -> int:
         digest = hashlib.sha256(cat_id.encode("utf-8")).hexdigest()
@@ -56,14 +56,12 @@ class CatService:
         profile = self.profile_store.get_profile(cat_id)
         if not profile:
             raise CatNotFoundError(f"Cat '{cat_id}' not found")
-        
-        stats = self.action_history.get_history_stats(cat_id)
-        
+
         return {
             "cat_id": cat_id,
             "model_path": str(self.profile_store.get_profile_path(cat_id)),
             "created_at": profile.created_at,
-            "total_actions": stats["total_actions"],
+            "total_actions": self.action_history.get_total_actions(cat_id),
         }
 
     def get_profile_summary(self, cat_id: str) -> dict:
@@ -557,7 +557,8 @@ class ContextualBehaviorEngine:
         base_meta = self.axis_states.get(cat_id, {}).get("base")
         mood_meta = self.axis_states.get(cat_id, {}).get("mood")
 
-        base_axis = EmotionAxis(
+        # Every field comes from already-typed engine state, so skip pydantic validation.
+        base_axis = EmotionAxis.model_construct(
             emotion=base_state.primary_emotion.value,
             intensity=base_state.intensity.value,
             arousal=base_state.arousal_level,
@@ -566,7 +567,7 @@ class ContextualBehaviorEngine:
             expires_at=None,
             source="base",
         )
-        mood_axis = EmotionAxis(
+        mood_axis = EmotionAxis.model_construct(
             emotion=mood_state.primary_emotion.value,
             intensity=mood_state.intensity.value,
             arousal=mood_state.arousal_level,
@@ -578,7 +579,7 @@ class ContextualBehaviorEngine:
 
         reaction_axis = None
         if reaction_state is not None and reaction_state.emotion and reaction_state.intensity:
-            reaction_axis = EmotionAxis(
+            reaction_axis = EmotionAxis.model_construct(
                 emotion=reaction_state.emotion,
                 intensity=reaction_state.intensity,
                 arousal=reaction_state.arousal,
@@ -588,7 +589,7 @@ class ContextualBehaviorEngine:
                 source="reaction",
             )
 
-        return EmotionAxes(base=base_axis, mood=mood_axis, reaction=reaction_axis)
+        return EmotionAxes.model_construct(base=base_axis, mood=mood_axis, reaction=reaction_axis)
 
     def _build_visual_layers(
         self,
@@ -600,7 +601,7 @@ class ContextualBehaviorEngine:
             axis_weight = self.AXIS_WEIGHTS.get(axis.source, 0.5)
             intensity_factor = self.INTENSITY_WEIGHTS.get(axis.intensity, 0.6)
             weight = max(0.0, min(1.0, axis_weight * intensity_factor))
-            layers.append(VisualLayer(
+            layers.append(VisualLayer.model_construct(
                 source=axis.source,
                 emotion=axis.emotion,
                 intensity=axis.intensity,
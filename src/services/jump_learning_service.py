@@ -40,9 +40,15 @@ class JumpLearningService:
         JUMP_DATA_DIR.mkdir(parents=True, exist_ok=True)
     
     def get_jump_force(self, cat_id: str, target_id: str, height_diff: float, distance: float) -> float:
+        force, _ = self.lookup_jump_force(cat_id, target_id, height_diff, distance)
+        return force
+
+    def lookup_jump_force(
+        self, cat_id: str, target_id: str, height_diff: float, distance: float
+    ) -> tuple[float, bool]:
         self._load_cat_memory(cat_id)
         
-        memory = self._memories.get(cat_id, {}).get(target_id)
+        memory = self._memories[cat_id].get(target_id)
         
         if memory is not None:
             logger.info(
@@ -52,7 +58,7 @@ class JumpLearningService:
                 force=memory.learned_force,
                 successes=memory.success_count
             )
-            return memory.learned_force
+            return memory.learned_force, True
         
         base_force = DEFAULT_JUMP_FORCE
         if height_diff > 0.5:
@@ -65,7 +71,7 @@ class JumpLearningService:
             height_diff=height_diff,
             force=base_force
         )
-        return min(base_force, MAX_JUMP_FORCE)
+        return min(base_force, MAX_JUMP_FORCE), False
     
     def record_jump_result(
         self,
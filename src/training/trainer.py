@@ -8,7 +8,7 @@ import numpy as np
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import CallbackList
 
-from src.core.config import PPOConfig, Settings, TrainingConfig
+from src.core.config import PPOConfig, Settings, TrainingConfig, settings
 from src.core.environment import CatEnvironment
 from src.training.callbacks import get_training_callbacks
 from src.utils.logger import get_logger
@@ -21,6 +21,7 @@ class CatBrainTrainer:
         self.config = config
         self.model_path = Path(config.MODEL_PATH)
         self.model_path.mkdir(parents=True, exist_ok=True)
+        self.cats_path = self.model_path / "cats"
 
     def train(
         self,
@@ -108,7 +109,7 @@ class CatBrainTrainer:
         cat_id: Optional[str] = None,
     ) -> None:
         if cat_id:
-            version_path = self.model_path / "cats" / cat_id / version
+            version_path = self.cats_path / cat_id / version
         else:
             version_path = self.model_path / version
         version_path.mkdir(parents=True, exist_ok=True)
@@ -129,7 +130,7 @@ class CatBrainTrainer:
             json.dump(metadata, f, indent=2)
 
         if cat_id:
-            latest_link = self.model_path / "cats" / cat_id / "latest"
+            latest_link = self.cats_path / cat_id / "latest"
         else:
             latest_link = self.model_path / "latest"
         
@@ -154,7 +155,7 @@ class CatBrainTrainer:
                 f"Default model not found at {default_model_path}. Train a base model first."
             )
         
-        cat_brain_dir = self.model_path / "cats" / cat_id / "latest"
+        cat_brain_dir = self.cats_path / cat_id / "latest"
         cat_brain_dir.mkdir(parents=True, exist_ok=True)
         
         cat_brain_path = cat_brain_dir / "cat_brain.zip"
@@ -183,7 +184,7 @@ class CatBrainTrainer:
         total_timesteps: int = 10_000,
     ) -> PPO:
 
-        cat_model_path = self.model_path / "cats" / cat_id / "latest" / "cat_brain.zip"
+        cat_model_path = self.cats_path / cat_id / "latest" / "cat_brain.zip"
         
         if not cat_model_path.exists():
             raise FileNotFoundError(
@@ -199,7 +200,7 @@ class CatBrainTrainer:
         env = CatEnvironment()
         model = PPO.load(str(cat_model_path), env=env)
         
-        checkpoint_path = str(self.model_path / "cats" / cat_id / "checkpoints")
+        checkpoint_path = str(self.cats_path / cat_id / "checkpoints")
         callbacks = get_training_callbacks(
             checkpoint_path,
             checkpoint_freq=TrainingConfig.CHECKPOINT_FREQ,
@@ -230,8 +231,7 @@ class CatBrainTrainer:
 
 
 def main():
-    config = Settings()
-    trainer = CatBrainTrainer(config)
+    trainer = CatBrainTrainer(settings)
     trainer.train()
 
 
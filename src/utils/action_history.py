@@ -25,6 +25,7 @@ class ActionHistory:
         self.max_entry_age_days = max_entry_age_days if max_entry_age_days > 0 else None
         self.cleanup_interval_actions = max(1, cleanup_interval_actions)
         self._writes_since_cleanup = 0
+        self._entry_counts: dict[str, int] = {}
         self._lock = RLock()
 
     def log_action(
@@ -77,10 +78,18 @@ class ActionHistory:
         cat_history_file = self.history_path / f"{cat_id}.jsonl"
 
         with self._lock:
+            self._entry_counts.pop(cat_id, None)
             if cat_history_file.exists():
                 cat_history_file.unlink()
                 logger.info("action_history_cleared", cat_id=cat_id)
 
+    def get_total_actions(self, cat_id: str) -> int:
+        with self._lock:
+            count = self._entry_counts.get(cat_id)
+            if count is None:
+                count = self._entry_counts[cat_id] = self._count_entries(cat_id)
+            return count
+
     def get_history_stats(self, cat_id: str) -> dict:
         history = self.get_history(cat_id)
 
@@ -99,11 +108,27 @@ class ActionHistory:
             "last_action": history[-1]["timestamp"],
         }
 
+    def _count_entries(self, cat_id: str) -> int:
+        cat_history_file = self.history_path / f"{cat_id}.jsonl"
+
+        if not cat_history_file.exists():
+            return 0
+
+        try:
+            with open(cat_history_file, "r", encoding="utf-8") as f:
+                return sum(1 for line in f if line.strip())
+        except Exception as e:
+            logger.error("action_history_read_failed", cat_id=cat_id, error=str(e))
+            return 0
+
     def _cleanup_all_histories(self) -> None:
         for history_file in self.history_path.glob("*.jsonl"):
             self._prune_cat_history(history_file)
 
     def _prune_cat_history(self, cat_history_file: Path) -> None:
+        # Every write goes through here, so this keeps get_total_actions exact.
+        self._entry_counts.pop(cat_history_file.stem, None)
+
         if not cat_history_file.exists():
             return
 
@@ -132,6 +157,7 @@ class ActionHistory:
 
         new_lines = [json.dumps(entry) for entry in entries]
         if new_lines == raw_lines:
+            self._entry_counts[cat_history_file.stem] = len(new_lines)
             return
 
         try:
@@ -141,6 +167,7 @@ class ActionHistory:
 
             with open(cat_history_file, "w", encoding="utf-8") as f:
                 f.write("\n".join(new_lines) + "\n")
+            self._entry_counts[cat_history_file.stem] = len(new_lines)
         except Exception as e:
             logger.error(
                 "action_history_prune_write_failed",
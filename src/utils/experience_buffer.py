@@ -0,0 +1,129 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+STATE_FIELDS: tuple[str, ...] = (
+    "hunger",
+    "energy",
+    "distance_to_food",
+    "distance_to_toy",
+    "mood",
+    "lazy_score",
+    "foodie_score",
+    "playful_score",
+)
+STATE_SIZE: int = len(STATE_FIELDS)
+TRANSITION_SIZE: int = 2 * STATE_SIZE
+
+# Every state field is validated to [0, 100], so transitions are stored as uint8 steps of 100/255.
+STATE_MAX: float = 100.0
+_QUANT_SCALE: float = 255.0 / STATE_MAX
+_DEQUANT_SCALE: float = STATE_MAX / 255.0
+
+_RNG = np.random.default_rng()
+
+
+class ExperienceBuffer:
+    def __init__(self, capacity: int = 10_000):
+        self.capacity = max(1, capacity)
+        # Each row is state || next_state, so a transition is one contiguous 16-byte write.
+        self.transitions = np.empty((self.capacity, TRANSITION_SIZE), dtype=np.uint8)
+        self.states = self.transitions[:, :STATE_SIZE]
+        self.next_states = self.transitions[:, STATE_SIZE:]
+        self.actions = np.empty(self.capacity, dtype=np.int8)
+        self.rewards = np.empty(self.capacity, dtype=np.float32)
+        self.dones = np.empty(self.capacity, dtype=np.bool_)
+        self.pos = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def append(
+        self,
+        state: Sequence[float],
+        action: int,
+        reward: float,
+        next_state: Sequence[float],
+        done: bool,
+    ) -> None:
+        pos = self.pos
+        self.transitions[pos] = _quantize(np.array((*state, *next_state), dtype=np.float32))
+        self.actions[pos] = action
+        self.rewards[pos] = reward
+        self.dones[pos] = done
+        self.pos = (pos + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(
+        self,
+        transitions: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        n = len(actions)
+        if n > self.capacity:
+            # Only the newest rows would survive the wrap-around anyway.
+            transitions, actions, rewards, dones = (
+                column[-self.capacity :] for column in (transitions, actions, rewards, dones)
+            )
+            n = self.capacity
+
+        transitions = _quantize(transitions)
+        first = min(n, self.capacity - self.pos)
+        for target, column in (
+            (self.transitions, transitions),
+            (self.actions, actions),
+            (self.rewards, rewards),
+            (self.dones, dones),
+        ):
+            target[self.pos : self.pos + first] = column[:first]
+            target[: n - first] = column[first:]
+
+        self.pos = (self.pos + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def drain(self) -> dict[str, np.ndarray]:
+        # Oldest-first copies of the stored rows; the buffer is empty afterwards.
+        transitions = np.multiply(self._ordered(self.transitions), _DEQUANT_SCALE, dtype=np.float32)
+        experiences = {
+            "transitions": transitions,
+            "states": transitions[:, :STATE_SIZE],
+            "next_states": transitions[:, STATE_SIZE:],
+            "actions": self._ordered(self.actions),
+            "rewards": self._ordered(self.rewards),
+            "dones": self._ordered(self.dones),
+        }
+        self.clear()
+        return experiences
+
+    def sample(self, batch_size: int, rng: Optional[np.random.Generator] = None) -> dict[str, np.ndarray]:
+        if self.size == 0:
+            raise ValueError("Cannot sample from an empty experience buffer")
+
+        rng = rng or _RNG
+        # Rows [0, size) are always the filled ones: pos == size until the ring wraps.
+        idx = rng.integers(0, self.size, size=batch_size)
+        transitions = np.multiply(self.transitions[idx], _DEQUANT_SCALE, dtype=np.float32)
+        return {
+            "transitions": transitions,
+            "states": transitions[:, :STATE_SIZE],
+            "next_states": transitions[:, STATE_SIZE:],
+            "actions": self.actions[idx],
+            "rewards": self.rewards[idx],
+            "dones": self.dones[idx],
+        }
+
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        if self.size < self.capacity:
+            return column[: self.size].copy()
+        return np.concatenate((column[self.pos :], column[: self.pos]))
+
+    def clear(self) -> None:
+        self.pos = 0
+        self.size = 0
+
+
+def _quantize(values: np.ndarray) -> np.ndarray:
+    return np.rint(np.clip(values, 0.0, STATE_MAX) * _QUANT_SCALE).astype(np.uint8)
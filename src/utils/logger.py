@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 import structlog
 
@@ -11,9 +14,16 @@ def setup_logger(log_level: str = "INFO"):
     if _configured:
         return
 
+    # Records are written to stdout by a listener thread, so request handlers never block on I/O.
+    stream_handler = logging.StreamHandler(sys.stdout)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        handlers=[QueueHandler(log_queue)],
         level=getattr(logging, log_level.upper(), logging.INFO),
     )
 
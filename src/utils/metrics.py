@@ -1,7 +1,7 @@
 import time
 from typing import Callable
 
-from prometheus_client import Counter, Gauge, Histogram, generate_latest
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
@@ -46,11 +46,11 @@ CACHE_MISSES = Counter("cache_misses_total", "Total number of cache misses")
 
 class MetricsMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+        start_time = time.monotonic()
 
         response = await call_next(request)
 
-        latency = time.time() - start_time
+        latency = time.monotonic() - start_time
         endpoint = request.url.path
         method = request.method
         status = str(response.status_code)
@@ -74,5 +74,18 @@ class MetricsMiddleware(BaseHTTPMiddleware):
         return response
 
 
+METRICS_CACHE_TTL: float = 0.5
+METRICS_CONTENT_TYPE: str = CONTENT_TYPE_LATEST
+
+_metrics_payload: bytes = b""
+_metrics_expires_at: float = 0.0
+
+
 def get_metrics() -> bytes:
-    return generate_latest()
+    # Scrapers poll faster than the counters move; reuse the rendered exposition briefly.
+    global _metrics_payload, _metrics_expires_at
+    now = time.monotonic()
+    if now >= _metrics_expires_at:
+        _metrics_payload = generate_latest()
+        _metrics_expires_at = now + METRICS_CACHE_TTL
+    return _metrics_payload
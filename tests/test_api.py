@@ -4,6 +4,9 @@ import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
+from src.api.app import create_app
+from src.api.dependencies import get_model_loader, get_predictor
+from src.api.health import HEALTH_CACHE_TTL, READINESS_CACHE_TTL, ProbeCache
 from src.api.main import app
 
 
@@ -46,7 +49,9 @@ def client(mock_predictor, mock_model_loader):
     app.state.model_loader = mock_model_loader
     app.state.settings = MagicMock()
     app.state.settings.MODEL_VERSION = "latest"
-    app.state.start_time = 0
+    app.state.start_monotonic = 0
+    app.state.health_cache = ProbeCache(HEALTH_CACHE_TTL)
+    app.state.readiness_cache = ProbeCache(READINESS_CACHE_TTL)
 
     return TestClient(app, raise_server_exceptions=False)
 
@@ -146,6 +151,15 @@ class TestHealthEndpoints:
         assert "model_loaded" in data
         assert "uptime" in data
 
+    def test_health_cache_lives_on_app_state(self, client, mock_model_loader):
+        assert client.get("/health").json()["status"] == "healthy"
+
+        mock_model_loader.get_model.return_value = None
+        assert client.get("/health").json()["status"] == "healthy"
+
+        app.state.health_cache = ProbeCache(HEALTH_CACHE_TTL)
+        assert client.get("/health").json()["status"] == "degraded"
+
     def test_liveness_check(self, client):
         response = client.get("/live")
 
@@ -158,3 +172,17 @@ class TestHealthEndpoints:
 
         assert response.status_code == 200
         assert "text/plain" in response.headers["content-type"]
+
+
+class TestLifespan:
+    def test_keeps_overrides_installed_before_startup(self, mock_model_loader):
+        test_app = create_app()
+        override = lambda: mock_model_loader
+        test_app.dependency_overrides[get_model_loader] = override
+
+        with TestClient(test_app) as test_client:
+            assert test_app.dependency_overrides[get_model_loader] is override
+            assert get_predictor in test_app.dependency_overrides
+            assert test_client.get("/models/latest").json()["total_timesteps"] == 100000
+
+        assert test_app.dependency_overrides == {get_model_loader: override}
@@ -1,6 +1,11 @@
+import numpy as np
+import pytest
+
 from src.api.schemas import CatState
 from src.core.behavior import BehaviorLibrary, StochasticBehavior
+from src.core.emotions import EmotionEngine
 from src.core.environment import CatAction
+from src.core.reactions import ReactionModifier, ReactionSystem
 from src.services.contextual_engine import ContextualBehaviorEngine
 
 
@@ -244,3 +249,67 @@ def test_high_nickname_match_increases_player_call_response(monkeypatch):
         cat_id="cat-call-4",
     )
     assert high_signal_result["action"] == CatAction.EXPLORE
+
+
+def test_batched_emotional_state_matches_single_path():
+    rng = np.random.default_rng(7)
+    mood = rng.uniform(0, 100, 500)
+    hunger = rng.uniform(0, 100, 500)
+    energy = rng.uniform(0, 100, 500)
+
+    batch = EmotionEngine.get_emotional_state_batch(mood, hunger, energy, recent_activity=0.4)
+
+    for i in range(500):
+        single = EmotionEngine.get_emotional_state(mood[i], hunger[i], energy[i], recent_activity=0.4)
+        assert batch["emotion"][i] is single.primary_emotion
+        assert batch["intensity"][i] is single.intensity
+        assert batch["arousal"][i] == pytest.approx(single.arousal_level)
+
+
+@pytest.mark.parametrize(
+    ("draw", "mood", "energy", "expected"),
+    [
+        (0.049, 50.0, 80.0, CatAction.GROOM),
+        (0.06, 50.0, 80.0, CatAction.EXPLORE),
+        (0.09, 50.0, 80.0, CatAction.MEOW_AT_BOWL),
+        (0.10, 50.0, 80.0, None),
+        (0.10, 80.0, 80.0, CatAction.PLAY),
+        (0.14, 80.0, 30.0, CatAction.SLEEP),
+        (0.99, 80.0, 30.0, None),
+    ],
+)
+def test_quirk_action_matches_sequential_draws(monkeypatch, draw, mood, energy, expected):
+    # Sequential draws give GROOM below 0.05, then EXPLORE up to 0.0785, MEOW up
+    # to 0.0969, PLAY up to 0.1331 and SLEEP up to 0.1851 for the full table.
+    monkeypatch.setattr("src.core.behavior.random.random", lambda: draw)
+
+    assert BehaviorLibrary.get_random_quirk_action(mood, energy) == expected
+
+
+def test_batched_noise_only_swaps_to_other_actions():
+    base = np.tile(np.arange(8), 500)
+    rng = np.random.default_rng(3)
+
+    unchanged = StochasticBehavior.add_noise_to_predictions_batch(base, confidence=1.0, rng=rng)
+    noisy = StochasticBehavior.add_noise_to_predictions_batch(
+        base, confidence=0.0, mood=np.full(len(base), 10.0), rng=rng
+    )
+
+    assert np.array_equal(unchanged, base)
+    changed = noisy != base
+    assert changed.mean() == pytest.approx(0.3, abs=0.05)
+    assert noisy.min() >= 0 and noisy.max() <= 7
+    assert set(noisy[changed & (base == 7)].tolist()) == set(range(7))
+
+
+@pytest.mark.parametrize(
+    ("draw", "expected"),
+    [(0.0, CatAction.GROOM), (0.66, CatAction.GROOM), (0.67, CatAction.IDLE), (0.999, CatAction.IDLE)],
+)
+def test_reaction_action_draw_uses_unnormalized_weights(monkeypatch, draw, expected):
+    # Weights sum to 0.9, so GROOM covers draws below 0.6 / 0.9.
+    draws = iter([0.5, draw])
+    monkeypatch.setattr("src.core.reactions.random.random", lambda: next(draws))
+    reaction = ReactionModifier(action_probabilities={4: 0.6, 0: 0.3})
+
+    assert ReactionSystem.apply_reaction(CatAction.PLAY, reaction) == expected
@@ -1,6 +1,9 @@
+import numpy as np
+import pytest
 from gymnasium.spaces import Box, Discrete
 
 from src.core.environment import CatEnvironment
+from src.core.vec_environment import BatchedCatEnvironment
 
 
 class TestCatEnvironment:
@@ -114,3 +117,84 @@ class TestCatEnvironment:
             assert isinstance(reward, (int, float))
             if terminated or truncated:
                 env.reset()
+
+    def test_pooled_draws_follow_generator_stream(self):
+        env = CatEnvironment()
+        env.reset(seed=3)
+        expected = np.random.default_rng(3)
+
+        assert env.hunger == expected.uniform(20.0, 50.0)
+        for _ in range(6):
+            expected.random()
+        assert [env._respawn_distance() for _ in range(300)] == [
+            expected.uniform(5.0, 100.0) for _ in range(300)
+        ]
+
+        env.reset(seed=3)
+        assert env.hunger == np.random.default_rng(3).uniform(20.0, 50.0)
+
+
+class TestBatchedCatEnvironment:
+    @staticmethod
+    def _sync(env, batched, i):
+        env.hunger = float(batched.hunger[i])
+        env.energy = float(batched.energy[i])
+        env.distance_to_food = float(batched.distance_to_food[i])
+        env.distance_to_toy = float(batched.distance_to_toy[i])
+        env.distance_to_bed = float(batched.distance_to_bed[i])
+        env.mood = float(batched.mood[i])
+        env.is_bowl_empty = bool(batched.is_bowl_empty[i])
+        env.is_bowl_tipped = bool(batched.is_bowl_tipped[i])
+        env.personality_scores = {
+            "lazy": float(batched.lazy_score[i]),
+            "foodie": float(batched.foodie_score[i]),
+            "playful": float(batched.playful_score[i]),
+        }
+        env.recent_rewards.clear()
+        env._recent_reward_sum = 0.0
+        env.steps = 0
+
+    def test_set_attr_rejects_partial_indices(self):
+        batched = BatchedCatEnvironment(4, seed=0)
+        batched.set_attr("max_steps", 50, indices=[3, 1, 0, 2])
+        assert batched.get_attr("max_steps") == [50] * 4
+        with pytest.raises(ValueError, match="max_steps"):
+            batched.set_attr("max_steps", 10, indices=[0, 1])
+        assert batched.max_steps == 50
+
+    def test_env_method_names_unsupported_method(self):
+        batched = BatchedCatEnvironment(2, seed=0)
+        with pytest.raises(AttributeError, match="render"):
+            batched.env_method("render")
+
+    def test_matches_scalar_environments(self, monkeypatch):
+        # Respawn draws come from different streams, so pin them on both sides.
+        monkeypatch.setattr(CatEnvironment, "_respawn_distance", lambda self: 50.0)
+        monkeypatch.setattr(
+            BatchedCatEnvironment, "_respawn_distances", lambda self, n: np.full(n, 50.0)
+        )
+        num_envs = 16
+        batched = BatchedCatEnvironment(num_envs, seed=0)
+        batched.max_steps = 150
+        obs = batched.reset()
+        envs = []
+        for i in range(num_envs):
+            env = CatEnvironment()
+            env.reset(seed=i)
+            env.max_steps = 150
+            self._sync(env, batched, i)
+            envs.append(env)
+
+        rng = np.random.default_rng(1)
+        for _ in range(400):
+            actions = rng.integers(0, 8, size=num_envs)
+            obs, rewards, dones, infos = batched.step(actions)
+            for i, env in enumerate(envs):
+                env_obs, reward, terminated, truncated, _ = env.step(actions[i])
+                assert rewards[i] == np.float32(reward)
+                assert dones[i] == (terminated or truncated)
+                if dones[i]:
+                    assert np.array_equal(infos[i]["terminal_observation"], env_obs)
+                    self._sync(env, batched, i)
+                else:
+                    assert np.array_equal(obs[i], env_obs)
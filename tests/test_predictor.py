@@ -7,9 +7,11 @@ import numpy as np
 import pytest
 
 from src.core.config import Settings
+from src.inference.greedy_policy import GreedyPolicy
 from src.inference.model_loader import ModelLoader
 from src.inference.predictor import BatchPredictor
 from src.utils.action_history import ActionHistory
+from src.utils.experience_buffer import ExperienceBuffer
 
 
 @pytest.fixture
@@ -74,6 +76,57 @@ class TestBatchPredictor:
         assert len(actions) == 3
         predictor.stop()
 
+    @pytest.mark.asyncio
+    async def test_predict_batch_accepts_matrix(self, mock_model_loader, mock_settings, mock_model):
+        mock_model.predict.return_value = (np.array([3]), None)
+
+        predictor = BatchPredictor(mock_model_loader, mock_settings)
+
+        observations = np.full((3, 11), 50.0, dtype=np.float32)
+        actions = await predictor.predict_batch(observations)
+
+        assert actions == [3, 3, 3]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_predictions_share_one_forward_pass(
+        self, mock_model_loader, mock_settings, mock_model
+    ):
+        mock_model.predict.return_value = (np.array([0, 1, 2]), None)
+
+        predictor = BatchPredictor(mock_model_loader, mock_settings)
+        predictor.start()
+
+        await asyncio.sleep(0.01)
+
+        obs = np.full(11, 50.0, dtype=np.float32)
+        actions = await asyncio.gather(*(predictor.predict_single(obs) for _ in range(3)))
+
+        assert actions == [0, 1, 2]
+        assert mock_model.predict.call_count == 1
+        assert mock_model.predict.call_args[0][0].shape == (3, 11)
+        predictor.stop()
+
+    @pytest.mark.asyncio
+    async def test_predict_batch_reads_and_writes_cache_once(
+        self, mock_model_loader, mock_settings, mock_model
+    ):
+        mock_model.predict.return_value = (np.array([5]), None)
+
+        predictor = BatchPredictor(mock_model_loader, mock_settings)
+        predictor.cache.enabled = True
+        predictor.cache.redis = MagicMock()
+        predictor.cache.redis.mget.return_value = ["2", None, "4"]
+
+        observations = np.stack([np.full(11, value, dtype=np.float32) for value in (10.0, 20.0, 30.0)])
+        actions = await predictor.predict_batch(observations)
+
+        assert actions == [2, 5, 4]
+        assert predictor.cache.redis.mget.call_count == 1
+        pipe = predictor.cache.redis.pipeline.return_value
+        assert pipe.setex.call_count == 1
+        assert pipe.execute.call_count == 1
+        assert predictor.cache.redis.get.call_count == 0
+
     @pytest.mark.asyncio
     async def test_batch_timeout(self, mock_model_loader, mock_settings, mock_model):
         mock_settings.BATCH_SIZE = 100
@@ -109,6 +162,22 @@ class TestBatchPredictor:
         assert predictor._running is False
 
 
+class TestGreedyPolicy:
+    def test_matches_deterministic_ppo_predict(self):
+        from stable_baselines3 import PPO
+
+        from src.core.environment import CatEnvironment
+
+        model = PPO("MlpPolicy", CatEnvironment(), device="cpu", seed=0)
+        greedy = GreedyPolicy(model)
+        rng = np.random.default_rng(0)
+
+        for batch in (1, 5, 64):
+            observations = (rng.random((batch, 11)) * 100).astype(np.float32)
+            expected, _ = model.predict(observations, deterministic=True)
+            assert greedy.predict(observations).tolist() == expected.tolist()
+
+
 class TestActionHistory:
     def test_log_action_keeps_only_recent_entries_with_limit(self, tmp_path):
         history = ActionHistory(
@@ -164,3 +233,75 @@ class TestActionHistory:
 
         assert len(entries) == 2
         assert [entry["action"] for entry in entries] == [2, 3]
+
+    def test_get_total_actions_tracks_pruned_history(self, tmp_path):
+        history = ActionHistory(
+            history_path=str(tmp_path),
+            max_entries_per_cat=3,
+            max_entry_age_days=30,
+            cleanup_interval_actions=100,
+        )
+
+        assert history.get_total_actions("cat-1") == 0
+
+        for action in range(5):
+            history.log_action(
+                cat_id="cat-1",
+                observation=np.array([1.0, 2.0, 3.0], dtype=np.float32),
+                action=action,
+            )
+
+        assert history.get_total_actions("cat-1") == 3
+        assert ActionHistory(history_path=str(tmp_path)).get_total_actions("cat-1") == 3
+
+        history.clear_history("cat-1")
+        assert history.get_total_actions("cat-1") == 0
+
+
+class TestExperienceBuffer:
+    def test_extend_wraps_around_and_keeps_newest_rows(self):
+        buffer = ExperienceBuffer(capacity=4)
+        buffer.append(np.zeros(8), 0, 0.0, np.zeros(8), False)
+
+        transitions = np.arange(5 * 16, dtype=np.float32).reshape(5, 16)
+        buffer.extend(
+            transitions,
+            np.arange(1, 6, dtype=np.int8),
+            np.ones(5, dtype=np.float32),
+            np.zeros(5, dtype=np.bool_),
+        )
+
+        assert len(buffer) == 4
+        assert buffer.pos == 1
+        assert sorted(buffer.actions.tolist()) == [2, 3, 4, 5]
+
+        buffer.extend(transitions[:3], np.array([6, 7, 8], dtype=np.int8), np.ones(3), np.ones(3, dtype=np.bool_))
+
+        assert len(buffer) == 4
+        assert buffer.pos == 0
+        assert buffer.actions.tolist() == [5, 6, 7, 8]
+
+    def test_drain_returns_rows_oldest_first_and_empties_buffer(self):
+        buffer = ExperienceBuffer(capacity=3)
+        for action in range(5):
+            buffer.append(np.full(8, 10.0 * action), action, 0.0, np.full(8, 100.0 - action), False)
+
+        experiences = buffer.drain()
+
+        assert experiences["actions"].tolist() == [2, 3, 4]
+        assert experiences["states"].dtype == np.float32
+        assert experiences["states"][:, 0] == pytest.approx([20.0, 30.0, 40.0], abs=0.2)
+        assert experiences["next_states"][:, 0] == pytest.approx([98.0, 97.0, 96.0], abs=0.2)
+        assert len(buffer) == 0
+
+    def test_sample_draws_filled_rows_only(self):
+        buffer = ExperienceBuffer(capacity=8)
+        for action in range(3):
+            buffer.append(np.full(8, 40.0), action, float(action), np.full(8, 60.0), False)
+
+        batch = buffer.sample(16, rng=np.random.default_rng(0))
+
+        assert batch["transitions"].shape == (16, 16)
+        assert set(batch["actions"].tolist()) <= {0, 1, 2}
+        assert batch["rewards"].tolist() == batch["actions"].astype(float).tolist()
+        assert batch["states"] == pytest.approx(np.full((16, 8), 40.0), abs=0.2)
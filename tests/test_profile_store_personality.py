@@ -78,3 +78,16 @@ def test_version2_profile_uses_soft_blend_on_upgrade(tmp_path):
     assert upgraded.version == CatProfileStore.CURRENT_PROFILE_VERSION
     # Soft blend should preserve old neighborhood while nudging toward stronger playful profile.
     assert 0.85 <= upgraded.modifiers["playful_score"] <= 1.35
+
+
+def test_unknown_cat_lookup_does_not_memoize_path(tmp_path):
+    store = CatProfileStore(tmp_path / "cats")
+    store.create_profile("cat-known", "balanced")
+    store.get_profile_path("cat-known")
+    paths_before = dict(store._profile_paths)
+
+    assert store.get_profile("cat-missing") is None
+    assert not store.profile_exists("cat-missing")
+
+    assert store._profile_paths == paths_before
+    assert "cat-known" in store._profile_paths